@@ -12,9 +12,12 @@ import re
 import json
 import csv
 import io
+import os
+import copy
+import hashlib
 from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple
-from collections import Counter, defaultdict
+from typing import Dict, List, Optional, TextIO, Tuple
+from collections import Counter, OrderedDict, defaultdict
 from pathlib import Path
 import calendar as cal
 import logging
@@ -37,6 +40,9 @@ class ICSValidationError(ICSAnalysisError):
 class ICSAnalyzer:
     """Analyze AWS Change Calendar content and provide insights."""
     
+    # 解析結果を保持するファイル数（比較・差分で2ファイルを交互に解析しても再利用できる数）
+    _PARSE_CACHE_SIZE = 4
+    
     def __init__(self):
         """ICSファイル解析器初期化.
         
@@ -44,12 +50,17 @@ class ICSAnalyzer:
         """
         self.logger = logging.getLogger(__name__)
         self.analysis_result = None
+        self._parse_cache: Dict[Tuple[str, str], Dict] = OrderedDict()  # (絶対パス, 内容のSHA-256) -> 解析結果
     
     def parse_ics_file(self, filepath: str) -> Dict:
         """ICSファイル解析.
         
         要件3: ICS解析機能
         
+        最近解析したファイルと同じパス・同じ内容なら解析結果を再利用する
+        （解析日時のみ更新）。呼び出し側が結果を変更してもキャッシュに
+        影響しないよう、常にコピーを返す。
+        
         Args:
             filepath: ICSファイルパス
             
@@ -68,44 +79,88 @@ class ICSAnalyzer:
             with open(filepath, 'r', encoding='utf-8') as f:
                 ics_content = f.read()
             
-            # icalendarライブラリでパース
-            calendar = Calendar.from_ical(ics_content)
-            
-            # イベント抽出
-            events = self.extract_events(calendar)
-            
-            # 解析実行
-            analysis = self.analyze_events(events)
-            
-            # ファイル情報追加
-            file_info = {
-                'filepath': filepath,
-                'file_size': len(ics_content.encode('utf-8')),
-                'total_events': len(events),
-                'analysis_date': datetime.now().isoformat()
-            }
-            
-            # 検証実行
-            validation_errors = self.validate_ics_format(calendar)
+            # 同一内容の再解析を回避
+            cache_key = (
+                os.path.abspath(filepath),
+                hashlib.sha256(ics_content.encode('utf-8')).hexdigest()
+            )
+            cached = self._parse_cache.get(cache_key)
+            if cached is not None:
+                self._parse_cache.move_to_end(cache_key)
+                self.analysis_result = copy.deepcopy(cached)
+                self.analysis_result['file_info']['analysis_date'] = datetime.now().isoformat()
+                return self.analysis_result
+            
+            self._parse_ics_content(ics_content, filepath)
+            self._parse_cache[cache_key] = copy.deepcopy(self.analysis_result)
+            if len(self._parse_cache) > self._PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
             
-            # 結果統合
-            self.analysis_result = {
-                'file_info': file_info,
-                'events': events,
-                'statistics': analysis,
-                'validation_errors': validation_errors
-            }
+            return self.analysis_result
             
-            self.logger.info(f"ICSファイル解析完了: {filepath} ({len(events)} イベント)")
+        except Exception as e:
+            if isinstance(e, ICSAnalysisError):
+                raise
+            else:
+                raise ICSAnalysisError(f"ICSファイル解析失敗: {e}")
+    
+    def parse_ics_stream(self, stream: TextIO, source: str = '<stream>') -> Dict:
+        """ICSテキストストリーム解析.
+        
+        要件3: ICS解析機能
+        
+        Args:
+            stream: ICS内容を読み出すテキストストリーム
+            source: 解析結果のfile_info['filepath']に記録する名前
             
-            return self.analysis_result
+        Returns:
+            解析結果辞書
             
+        Raises:
+            ICSAnalysisError: 解析エラー
+        """
+        try:
+            return self._parse_ics_content(stream.read(), source)
         except Exception as e:
             if isinstance(e, ICSAnalysisError):
                 raise
             else:
                 raise ICSAnalysisError(f"ICSファイル解析失敗: {e}")
     
+    def _parse_ics_content(self, ics_content: str, filepath: str) -> Dict:
+        """ICS文字列を解析してanalysis_resultに格納."""
+        # icalendarライブラリでパース
+        calendar = Calendar.from_ical(ics_content)
+        
+        # イベント抽出
+        events = self.extract_events(calendar)
+        
+        # 解析実行
+        analysis = self.analyze_events(events)
+        
+        # ファイル情報追加
+        file_info = {
+            'filepath': filepath,
+            'file_size': len(ics_content.encode('utf-8')),
+            'total_events': len(events),
+            'analysis_date': datetime.now().isoformat()
+        }
+        
+        # 検証実行
+        validation_errors = self.validate_ics_format(calendar)
+        
+        # 結果統合
+        self.analysis_result = {
+            'file_info': file_info,
+            'events': events,
+            'statistics': analysis,
+            'validation_errors': validation_errors
+        }
+        
+        self.logger.info(f"ICSファイル解析完了: {filepath} ({len(events)} イベント)")
+        
+        return self.analysis_result
+    
     def extract_events(self, calendar: Calendar) -> List[Dict]:
         """イベント情報抽出.
         
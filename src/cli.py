@@ -29,6 +29,37 @@ from .logging_config import (
 import json
 
 
+def _build_context_obj(config: Optional[str], profile: Optional[str], region: Optional[str],
+                       debug: bool, log_level: str, log_format: str, enable_monitoring: bool) -> dict:
+    """Build the context object the root group passes to every subcommand.
+    
+    Returns:
+        Dict with the 'logging_manager' and 'config' entries subcommands read
+    """
+    # Setup logging and monitoring
+    log_level_enum = getattr(LogLevel, log_level)
+    log_format_enum = getattr(LogFormat, log_format.upper())
+    
+    logging_manager = setup_logging(
+        log_level=log_level_enum,
+        log_format=log_format_enum,
+        enable_performance_monitoring=enable_monitoring,
+        enable_system_monitoring=enable_monitoring,
+        debug_mode=debug
+    )
+    
+    # Load configuration
+    app_config = Config(config)
+    
+    # Override config with CLI options
+    if profile:
+        app_config.set('aws.profile', profile)
+    if region:
+        app_config.set('aws.region', region)
+    
+    return {'logging_manager': logging_manager, 'config': app_config}
+
+
 @click.group()
 @click.option('--config', '-c', help='Configuration file path')
 @click.option('--profile', '-p', help='AWS profile name')
@@ -52,28 +83,9 @@ def cli(ctx, config: Optional[str], profile: Optional[str], region: Optional[str
     ctx.ensure_object(dict)
     
     try:
-        # Setup logging and monitoring
-        log_level_enum = getattr(LogLevel, log_level)
-        log_format_enum = getattr(LogFormat, log_format.upper())
-        
-        logging_manager = setup_logging(
-            log_level=log_level_enum,
-            log_format=log_format_enum,
-            enable_performance_monitoring=enable_monitoring,
-            enable_system_monitoring=enable_monitoring,
-            debug_mode=debug
-        )
-        
-        ctx.obj['logging_manager'] = logging_manager
-        
-        # Load configuration
-        ctx.obj['config'] = Config(config)
-        
-        # Override config with CLI options
-        if profile:
-            ctx.obj['config'].set('aws.profile', profile)
-        if region:
-            ctx.obj['config'].set('aws.region', region)
+        ctx.obj.update(_build_context_obj(
+            config, profile, region, debug, log_level, log_format, enable_monitoring
+        ))
             
     except Exception as e:
         error = ConfigurationError(
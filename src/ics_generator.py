@@ -49,6 +49,8 @@ class ICSGenerator:
         self.logger = logging.getLogger(__name__)
         self.tokyo_tz = pytz.timezone('Asia/Tokyo')
         self._events_converted = False  # イベント変換済みフラグ
+        self._ics_content: Optional[str] = None  # 生成済みICS文字列（カレンダー変更時に破棄）
+        self._ics_content_state: Optional[Tuple] = None  # 生成時のカレンダー状態
         self.exclude_sunday_holidays = exclude_sunday_holidays  # 日曜祝日除外フラグ
         
         # AWS SSM Change Calendar専用カレンダー作成
@@ -61,6 +63,7 @@ class ICSGenerator:
         """
         try:
             self.calendar = Calendar()
+            self._invalidate_ics_content()
             
             # AWS SSM Change Calendar必須プロパティ
             self.calendar.add('prodid', '-//AWS//Change Calendar 1.0//EN')
@@ -97,7 +100,7 @@ class ICSGenerator:
             tz_standard.add('tzname', 'JST')
             
             tz_component.add_component(tz_standard)
-            self.calendar.add_component(tz_component)
+            self._add_component(tz_component)
             
             self.logger.info("Asia/Tokyoタイムゾーン定義追加完了")
             
@@ -147,6 +150,11 @@ class ICSGenerator:
         
         要件2: 文字エンコーディング（UTF-8）、AWS SSM互換性
         
+        カレンダーが変更されるまで生成結果を再利用する。
+        self.calendarの差し替えやコンポーネント・プロパティの追加削除は
+        検出して再生成するが、既存コンポーネントの内容を直接書き換えた場合は
+        検出できないため、カレンダーはジェネレーターのメソッド経由で変更すること。
+        
         Returns:
             UTF-8エンコードされたICS文字列
             
@@ -154,6 +162,10 @@ class ICSGenerator:
             EncodingError: エンコーディングエラー
         """
         try:
+            state = self._calendar_state()
+            if self._ics_content is not None and self._ics_content_state == state:
+                return self._ics_content
+            
             # ICS形式に変換（祝日は明示的に追加されたもののみ）
             ics_bytes = self.calendar.to_ical()
             
@@ -163,6 +175,8 @@ class ICSGenerator:
             # AWS SSM互換性のためのクリーニング
             ics_content = self._clean_ics_content(ics_content)
             
+            self._ics_content = ics_content
+            self._ics_content_state = state
             self.logger.info("AWS SSM互換ICS形式文字列生成完了")
             return ics_content
             
@@ -171,6 +185,20 @@ class ICSGenerator:
         except Exception as e:
             raise ICSGenerationError(f"ICS形式文字列生成失敗: {e}")
     
+    def _add_component(self, component) -> None:
+        """カレンダーにコンポーネントを追加."""
+        self.calendar.add_component(component)
+        self._invalidate_ics_content()
+    
+    def _invalidate_ics_content(self) -> None:
+        """生成済みICS文字列を破棄（カレンダーを変更するメソッドは必ず呼び出す）."""
+        self._ics_content = None
+        self._ics_content_state = None
+    
+    def _calendar_state(self) -> Tuple:
+        """生成済みICS文字列の再利用判定に使うカレンダー状態."""
+        return (self.calendar, len(self.calendar.subcomponents), len(self.calendar))
+    
     def _clean_ics_content(self, content: str) -> str:
         """Clean ICS content by removing unwanted escape sequences.
         
@@ -398,7 +426,7 @@ class ICSGenerator:
                 
                 if uid not in existing_uids:
                     event = self.generate_holiday_event(holiday_date, holiday_name)
-                    self.calendar.add_component(event)
+                    self._add_component(event)
                     existing_uids.add(uid)
                     added_count += 1
                 else:
@@ -442,7 +470,7 @@ class ICSGenerator:
                 
                 if uid not in existing_uids:
                     event = self.generate_holiday_event(holiday_date, holiday_name)
-                    self.calendar.add_component(event)
+                    self._add_component(event)
                     existing_uids.add(uid)
                     added_count += 1
                 else:
@@ -468,6 +496,7 @@ class ICSGenerator:
             
             for component in components_to_remove:
                 self.calendar.subcomponents.remove(component)
+            self._invalidate_ics_content()
             
             # 変換済みフラグをリセット
             self._events_converted = False
@@ -494,7 +523,7 @@ class ICSGenerator:
             # 各祝日をイベントに変換
             for holiday_date, holiday_name in holidays:
                 event = self.generate_holiday_event(holiday_date, holiday_name)
-                self.calendar.add_component(event)
+                self._add_component(event)
             
             # 変換済みフラグを設定
             self._events_converted = True
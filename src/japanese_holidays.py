@@ -16,7 +16,7 @@
 import csv
 import requests
 from datetime import datetime, date
-from typing import Dict, List, Optional, Tuple, NamedTuple, Any
+from typing import Dict, Iterable, List, Optional, Tuple, NamedTuple, Any
 import os
 from pathlib import Path
 import chardet
@@ -995,6 +995,18 @@ class JapaneseHolidays:
         holidays = self._get_holidays()
         return check_date in holidays
     
+    def is_holiday_bulk(self, check_dates: Iterable[date]) -> List[bool]:
+        """Check many dates against the holiday data in a single call.
+        
+        Args:
+            check_dates: Dates to check
+            
+        Returns:
+            List of booleans in input order, True where the date is a holiday
+        """
+        holidays = self._get_holidays()
+        return [check_date in holidays for check_date in check_dates]
+    
     @lru_cache(maxsize=1000)
     def get_holiday_name(self, check_date: date) -> Optional[str]:
         """Get holiday name for a date.
@@ -9,14 +9,85 @@ path traversal attacks, injection attacks, and malformed input.
 import os
 import re
 import stat
+import threading
 from datetime import datetime, date
 from pathlib import Path
-from typing import Union, Optional
+from typing import Iterable, Optional, Union
 from urllib.parse import urlparse
 
 from .error_handler import ValidationError
 
 
+# Fixed layout of the ``notAfter`` field returned by ``SSLSocket.getpeercert``
+# (e.g. ``'Jun  1 12:00:00 2030 GMT'``); parsed directly instead of via strptime.
+_CERT_DATE_PATTERN = re.compile(
+    r'^(\w{3})\s+(\d{1,2})\s+(\d{2}):(\d{2}):(\d{2})\s+(\d{4})\s+(\w+)$'
+)
+_CERT_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
+
+def _parse_cert_date(value: str) -> datetime:
+    """
+    Parse an SSL certificate date string (``'%b %d %H:%M:%S %Y %Z'``).
+    
+    Args:
+        value: Certificate date string such as ``cert['notAfter']``
+        
+    Returns:
+        datetime: Naive datetime of the certificate date
+        
+    Raises:
+        ValueError: If the string does not match the certificate date layout
+    """
+    match = _CERT_DATE_PATTERN.match(value)
+    if match is None or match[1] not in _CERT_MONTHS:
+        raise ValueError(f"Unrecognized certificate date: {value!r}")
+    
+    return datetime(int(match[6]), _CERT_MONTHS[match[1]], int(match[2]),
+                    int(match[3]), int(match[4]), int(match[5]))
+
+
+class ValidatedPath(type(Path())):
+    """
+    Path that has already passed ``InputValidator.validate_file_path``.
+    
+    Only instances returned by the validator carry the marker; paths derived
+    from them (joins, parents, suffix changes) are validated again as usual.
+    """
+    
+    __slots__ = ('_validated',)
+    
+    @classmethod
+    def _from_validated(cls, path: str) -> 'ValidatedPath':
+        """Create a marked path from a validated, resolved path string."""
+        validated = cls(path)
+        validated._validated = True
+        return validated
+    
+    @property
+    def is_validated(self) -> bool:
+        """Whether this exact instance was produced by the validator."""
+        return getattr(self, '_validated', False)
+
+
+def _ensure_validated(file_path: Union[str, Path], **kwargs) -> Path:
+    """Validate a file path unless it is already a validated path.
+    
+    The marker only covers the path checks (length, null bytes, allowed
+    roots). Per-call requirements such as ``require_exists`` depend on the
+    filesystem at call time, so they are still checked for marked paths.
+    """
+    if (isinstance(file_path, ValidatedPath) and file_path.is_validated
+            and not kwargs.get('check_access')):
+        if kwargs.get('require_exists') and not file_path.exists():
+            raise ValidationError(f"File does not exist: {file_path}")
+        return file_path
+    return InputValidator.validate_file_path(file_path, **kwargs)
+
+
 class InputValidator:
     """
     Comprehensive input validation and sanitization class.
@@ -29,12 +100,16 @@ class InputValidator:
     # Regular expressions for validation
     CALENDAR_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
     DATE_PATTERNS = [
-        r'^\d{4}-\d{2}-\d{2}$',  # YYYY-MM-DD
-        r'^\d{4}/\d{2}/\d{2}$',  # YYYY/MM/DD
-        r'^\d{2}/\d{2}/\d{4}$',  # MM/DD/YYYY
-        r'^\d{2}-\d{2}-\d{4}$',  # MM-DD-YYYY
+        re.compile(r'^\d{4}-\d{2}-\d{2}$'),  # YYYY-MM-DD
+        re.compile(r'^\d{4}/\d{2}/\d{2}$'),  # YYYY/MM/DD
+        re.compile(r'^\d{2}/\d{2}/\d{4}$'),  # MM/DD/YYYY
+        re.compile(r'^\d{2}-\d{2}-\d{4}$'),  # MM-DD-YYYY
     ]
     
+    # Characters that indicate injection attempts
+    DATE_SUSPICIOUS_CHARS = frozenset('<>;&|`$()')
+    URL_SUSPICIOUS_CHARS = frozenset('<>"\'`')
+    
     # Maximum lengths for various inputs
     MAX_CALENDAR_NAME_LENGTH = 64
     MAX_FILE_PATH_LENGTH = 260  # Windows MAX_PATH limit
@@ -63,45 +138,55 @@ class InputValidator:
         if not isinstance(date_input, str):
             raise ValidationError(f"Invalid date input type: {type(date_input)}")
         
-        # Check length to prevent DoS attacks
+        # Cheapest checks first, before any regex work: reject non-ASCII input
+        # in a single C-level pass, then bound the length to prevent DoS attacks
+        if not date_input.isascii():
+            raise ValidationError("Date input contains non-ASCII characters")
+        
         if len(date_input) > cls.MAX_DATE_STRING_LENGTH:
             raise ValidationError(f"Date string too long: {len(date_input)} > {cls.MAX_DATE_STRING_LENGTH}")
         
-        # Sanitize input - remove whitespace and common injection characters
+        # Sanitize input - remove surrounding whitespace
         sanitized_input = date_input.strip()
         if not sanitized_input:
             raise ValidationError("Empty date input")
         
-        # Check for suspicious characters that might indicate injection attempts
-        suspicious_chars = ['<', '>', ';', '&', '|', '`', '$', '(', ')']
-        if any(char in sanitized_input for char in suspicious_chars):
-            raise ValidationError(f"Date input contains suspicious characters: {sanitized_input}")
-        
         # Validate format using regex patterns
         format_matched = False
         for pattern in cls.DATE_PATTERNS:
-            if re.match(pattern, sanitized_input):
+            if pattern.match(sanitized_input):
                 format_matched = True
                 break
         
         if not format_matched:
+            # Only digits and separators pass the format check, so injection
+            # characters are looked for on the rejection path only
+            if not cls.DATE_SUSPICIOUS_CHARS.isdisjoint(sanitized_input):
+                raise ValidationError(f"Date input contains suspicious characters: {sanitized_input}")
             raise ValidationError(f"Date format not recognized: {sanitized_input}")
         
-        # Try to parse the date using various formats
-        date_formats = [
-            '%Y-%m-%d',
-            '%Y/%m/%d',
-            '%m/%d/%Y',
-            '%m-%d-%Y',
-        ]
-        
         parsed_date = None
-        for date_format in date_formats:
+        
+        # ISO dates (YYYY-MM-DD) take the C-level fromisoformat fast path
+        if len(sanitized_input) == 10 and sanitized_input[4] == '-':
             try:
-                parsed_date = datetime.strptime(sanitized_input, date_format).date()
-                break
+                parsed_date = date.fromisoformat(sanitized_input)
             except ValueError:
-                continue
+                pass
+        else:
+            # Try to parse the remaining formats, which fromisoformat doesn't accept
+            date_formats = [
+                '%Y/%m/%d',
+                '%m/%d/%Y',
+                '%m-%d-%Y',
+            ]
+            
+            for date_format in date_formats:
+                try:
+                    parsed_date = datetime.strptime(sanitized_input, date_format).date()
+                    break
+                except ValueError:
+                    continue
         
         if parsed_date is None:
             raise ValidationError(f"Unable to parse date: {sanitized_input}")
@@ -163,17 +248,23 @@ class InputValidator:
     @classmethod
     def validate_file_path(cls, file_path: Union[str, Path], 
                           allow_create: bool = True,
-                          require_exists: bool = False) -> Path:
+                          require_exists: bool = False,
+                          check_access: bool = False) -> Path:
         """
         Validate file path and protect against path traversal attacks.
         
+        Permissions are not checked by default: the subsequent open/read/write
+        raises ``PermissionError`` anyway, and a pre-flight check would only
+        race with it.
+        
         Args:
             file_path: File path to validate
             allow_create: Whether to allow creation of new files
             require_exists: Whether the file must already exist
+            check_access: Whether to pre-check read/write access with os.access
             
         Returns:
-            Path: Validated and resolved file path
+            Path: Validated and resolved file path (a ``ValidatedPath``)
             
         Raises:
             ValidationError: If file path is invalid or unsafe
@@ -192,35 +283,27 @@ class InputValidator:
         if '\x00' in path_str:
             raise ValidationError("File path contains null bytes")
         
-        # Convert to Path object for manipulation
+        # Normalize lexically (no filesystem access), then resolve symlinks
         try:
-            path_obj = Path(path_str)
-        except (ValueError, OSError) as e:
-            raise ValidationError(f"Invalid file path: {e}")
-        
-        # Resolve the path to get absolute path and resolve symlinks
-        try:
-            resolved_path = path_obj.resolve()
-        except (OSError, RuntimeError) as e:
+            normalized_path = os.path.abspath(path_str)
+            resolved_str = os.path.realpath(normalized_path)
+        except (ValueError, OSError, RuntimeError) as e:
             raise ValidationError(f"Cannot resolve file path: {e}")
         
         # Check for path traversal attempts
-        # Ensure the resolved path is within allowed directories
-        cwd = Path.cwd().resolve()
-        home_dir = Path.home().resolve()
-        
         # Allow paths within current working directory or user home directory
-        allowed_roots = [cwd, home_dir]
+        cwd = os.getcwd()
+        home_dir = os.path.abspath(os.path.expanduser('~'))
         
-        # Check if the resolved path is under any allowed root
-        is_allowed = False
-        for allowed_root in allowed_roots:
-            try:
-                resolved_path.relative_to(allowed_root)
-                is_allowed = True
-                break
-            except ValueError:
-                continue
+        # No symlinks involved: the lexical path is the real path, so the
+        # string check suffices; otherwise compare against the real roots
+        is_allowed = (resolved_str == normalized_path
+                      and cls._is_within(resolved_str, (cwd, home_dir)))
+        if not is_allowed:
+            allowed_roots = (os.path.realpath(cwd), os.path.realpath(home_dir))
+            is_allowed = cls._is_within(resolved_str, allowed_roots)
+        
+        resolved_path = ValidatedPath._from_validated(resolved_str)
         
         if not is_allowed:
             raise ValidationError(f"File path outside allowed directories: {resolved_path}")
@@ -236,8 +319,8 @@ class InputValidator:
             except (OSError, PermissionError) as e:
                 raise ValidationError(f"Cannot create parent directory: {e}")
         
-        # Check permissions
-        if resolved_path.exists():
+        # Check permissions (optional pre-flight check)
+        if check_access and resolved_path.exists():
             if not os.access(resolved_path, os.R_OK):
                 raise ValidationError(f"File not readable: {resolved_path}")
             
@@ -246,6 +329,27 @@ class InputValidator:
         
         return resolved_path
     
+    @staticmethod
+    def _is_within(path: str, roots: Iterable[str]) -> bool:
+        """
+        Check whether an absolute path lies within any of the given roots.
+        
+        Args:
+            path: Absolute, normalized path
+            roots: Absolute, normalized root directories
+            
+        Returns:
+            bool: True if path equals or is below one of the roots
+        """
+        for root in roots:
+            try:
+                if os.path.commonpath((root, path)) == root:
+                    return True
+            except ValueError:
+                # Different drives or mixed absolute/relative paths
+                continue
+        return False
+    
     @classmethod
     def validate_url(cls, url: str, require_https: bool = True) -> str:
         """
@@ -281,8 +385,7 @@ class InputValidator:
             raise ValidationError(f"Invalid URL scheme: {parsed.scheme}")
         
         # Check for suspicious characters
-        suspicious_chars = ['<', '>', '"', "'", '`']
-        if any(char in url for char in suspicious_chars):
+        if not cls.URL_SUSPICIOUS_CHARS.isdisjoint(url):
             raise ValidationError(f"URL contains suspicious characters: {url}")
         
         # Basic hostname validation
@@ -302,6 +405,28 @@ class SecureFileHandler:
     READABLE_FILE_PERMISSIONS = 0o644  # rw-r--r--
     SECURE_DIR_PERMISSIONS = 0o700   # rwx------
     
+    @staticmethod
+    def _write_with_mode(path: Path, content: str, flags: int, permissions: int) -> None:
+        """
+        Open a file with the given creation mode and write UTF-8 content.
+        
+        The permissions are applied atomically at creation time (and re-applied
+        on the open descriptor so they are exact regardless of umask), so the
+        file is never visible with default permissions.
+        
+        Args:
+            path: Path to open
+            content: Content to write
+            flags: Additional ``os.open`` flags (e.g. ``os.O_EXCL``)
+            permissions: File permissions
+        """
+        flags |= os.O_WRONLY | os.O_CREAT | getattr(os, 'O_CLOEXEC', 0)
+        fd = os.open(str(path), flags, permissions)
+        with os.fdopen(fd, 'wb') as f:
+            if hasattr(os, 'fchmod'):
+                os.fchmod(f.fileno(), permissions)
+            f.write(content.encode('utf-8'))
+    
     @classmethod
     def create_secure_file(cls, file_path: Path, content: str = "", 
                           permissions: int = SECURE_FILE_PERMISSIONS) -> None:
@@ -313,23 +438,15 @@ class SecureFileHandler:
             content: Initial file content
             permissions: File permissions (default: 600)
         """
-        # Validate the file path first
-        validated_path = InputValidator.validate_file_path(file_path, allow_create=True)
+        # Validate the file path first (skipped if already validated)
+        validated_path = _ensure_validated(file_path, allow_create=True)
         
         # Create parent directories with secure permissions
         validated_path.parent.mkdir(parents=True, exist_ok=True, mode=cls.SECURE_DIR_PERMISSIONS)
         
-        # Write file with secure permissions
+        # Create/truncate and write the file with its final permissions
         try:
-            # Create file with restrictive permissions first
-            validated_path.touch(mode=cls.SECURE_FILE_PERMISSIONS)
-            
-            # Write content
-            validated_path.write_text(content, encoding='utf-8')
-            
-            # Set final permissions
-            validated_path.chmod(permissions)
-            
+            cls._write_with_mode(validated_path, content, os.O_TRUNC, permissions)
         except (OSError, PermissionError) as e:
             raise ValidationError(f"Cannot create secure file: {e}")
     
@@ -344,12 +461,11 @@ class SecureFileHandler:
         Returns:
             str: File content
         """
-        # Validate the file path
-        validated_path = InputValidator.validate_file_path(file_path, require_exists=True)
+        # Validate the file path (skipped if already validated)
+        validated_path = _ensure_validated(file_path, require_exists=True)
         
-        # Check file permissions
+        # Check file permissions (raw mode bits; no string formatting needed)
         file_stat = validated_path.stat()
-        file_mode = stat.filemode(file_stat.st_mode)
         
         # Warn if file is world-readable for sensitive files
         if file_stat.st_mode & stat.S_IROTH:
@@ -372,19 +488,22 @@ class SecureFileHandler:
             content: File content
             permissions: File permissions
         """
-        # Validate the file path
-        validated_path = InputValidator.validate_file_path(file_path, allow_create=True)
+        # Validate the file path (skipped if already validated)
+        validated_path = _ensure_validated(file_path, allow_create=True)
+        
+        # Write content atomically
+        temp_path = validated_path.with_suffix(validated_path.suffix + '.tmp')
         
         try:
-            # Write content atomically
-            temp_path = validated_path.with_suffix(validated_path.suffix + '.tmp')
+            # Discard a temp file left behind by an interrupted write
+            if temp_path.exists():
+                temp_path.unlink()
             
-            # Create temp file with secure permissions
-            temp_path.write_text(content, encoding='utf-8')
-            temp_path.chmod(permissions)
+            # Create temp file exclusively with secure permissions
+            cls._write_with_mode(temp_path, content, os.O_EXCL, permissions)
             
             # Atomic move
-            temp_path.replace(validated_path)
+            os.replace(temp_path, validated_path)
             
         except (OSError, PermissionError) as e:
             # Clean up temp file if it exists
@@ -414,11 +533,63 @@ def validate_url_input(url: str, require_https: bool = True) -> str:
     return InputValidator.validate_url(url, require_https)
 
 
+# Shared secure session reused across requests so connections stay alive
+_secure_session = None
+_secure_session_lock = threading.Lock()
+
+# Retry policy shared by every secure session (urllib3 copies it on each retry)
+_secure_retry = None
+
+
+def _get_secure_retry():
+    """
+    Get the shared retry policy for secure sessions, creating it on first use.
+    
+    Returns:
+        urllib3.util.retry.Retry: Shared retry policy
+    """
+    global _secure_retry
+    if _secure_retry is None:
+        from urllib3.util.retry import Retry
+        
+        _secure_retry = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=frozenset({"HEAD", "GET", "OPTIONS"})
+        )
+    return _secure_retry
+
+
 class NetworkSecurityManager:
     """
     Network security manager for HTTPS-only connections and SSL validation.
     """
     
+    @staticmethod
+    def get_secure_session():
+        """
+        Get the shared secure HTTP session, creating it on first use.
+        
+        Returns:
+            requests.Session: Shared configured secure session
+        """
+        global _secure_session
+        if _secure_session is None:
+            with _secure_session_lock:
+                if _secure_session is None:
+                    _secure_session = NetworkSecurityManager.create_secure_session()
+        return _secure_session
+    
+    @staticmethod
+    def close_secure_session() -> None:
+        """Close the shared secure HTTP session if it has been created."""
+        global _secure_session
+        with _secure_session_lock:
+            if _secure_session is not None:
+                _secure_session.close()
+                _secure_session = None
+    
     @staticmethod
     def create_secure_session():
         """
@@ -430,7 +601,6 @@ class NetworkSecurityManager:
         import requests
         import ssl
         from requests.adapters import HTTPAdapter
-        from urllib3.util.retry import Retry
         
         session = requests.Session()
         
@@ -439,15 +609,8 @@ class NetworkSecurityManager:
         ssl_context.check_hostname = True
         ssl_context.verify_mode = ssl.CERT_REQUIRED
         
-        # Configure retry strategy
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "OPTIONS"]
-        )
-        
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        # Mount a per-session adapter so closing one session never closes another's pool
+        adapter = HTTPAdapter(max_retries=_get_secure_retry())
         session.mount("https://", adapter)
         session.mount("http://", adapter)
         
@@ -506,9 +669,8 @@ class NetworkSecurityManager:
                         raise ValidationError(f"No SSL certificate found for: {hostname}")
                     
                     # Check certificate expiration
-                    import datetime
-                    not_after = datetime.datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
-                    if not_after < datetime.datetime.now():
+                    not_after = _parse_cert_date(cert['notAfter'])
+                    if not_after < datetime.now():
                         raise ValidationError(f"SSL certificate expired for: {hostname}")
                     
                     return True
@@ -544,8 +706,8 @@ class NetworkSecurityManager:
         # Validate SSL certificate
         NetworkSecurityManager.validate_ssl_certificate(validated_url)
         
-        # Create secure session
-        session = NetworkSecurityManager.create_secure_session()
+        # Reuse the shared secure session (keeps TCP/TLS connections alive)
+        session = NetworkSecurityManager.get_secure_session()
         
         try:
             # Set timeout if not provided
@@ -565,8 +727,6 @@ class NetworkSecurityManager:
             if isinstance(e, ValidationError):
                 raise
             raise ValidationError(f"Secure request failed: {e}")
-        finally:
-            session.close()
 
 
 class CredentialSecurityManager:
@@ -574,6 +734,13 @@ class CredentialSecurityManager:
     Secure credential storage and protection manager.
     """
     
+    # AWS credential formats (access key ID: AKIA + 16 chars, secret: 40 base64 chars)
+    AWS_ACCESS_KEY_ID_PATTERN = re.compile(r'^AKIA[A-Z0-9]{16}$')
+    AWS_SECRET_ACCESS_KEY_PATTERN = re.compile(r'^[A-Za-z0-9/+=]{40}$')
+    
+    # Key fragments marking a credential value as sensitive
+    SENSITIVE_KEYS = ('password', 'secret', 'key', 'token', 'credential')
+    
     @staticmethod
     def store_credentials_securely(credentials: dict, file_path: Path) -> None:
         """
@@ -584,7 +751,7 @@ class CredentialSecurityManager:
             file_path: Path to store credentials
         """
         # Validate file path
-        validated_path = InputValidator.validate_file_path(file_path, allow_create=True)
+        validated_path = _ensure_validated(file_path, allow_create=True)
         
         # Ensure credentials don't contain sensitive data in plain text
         sanitized_credentials = CredentialSecurityManager._sanitize_credentials(credentials)
@@ -610,7 +777,7 @@ class CredentialSecurityManager:
             dict: Sanitized credentials
         """
         sanitized = {}
-        sensitive_keys = ['password', 'secret', 'key', 'token', 'credential']
+        sensitive_keys = CredentialSecurityManager.SENSITIVE_KEYS
         
         for key, value in credentials.items():
             key_lower = key.lower()
@@ -619,13 +786,37 @@ class CredentialSecurityManager:
             is_sensitive = any(sensitive_word in key_lower for sensitive_word in sensitive_keys)
             
             if is_sensitive and isinstance(value, str) and len(value) > 4:
-                # Mask sensitive values
-                sanitized[key] = value[:2] + '*' * (len(value) - 4) + value[-2:]
+                # Mask sensitive values (one f-string build, no chained concatenation)
+                sanitized[key] = f"{value[:2]}{'*' * (len(value) - 4)}{value[-2:]}"
             else:
                 sanitized[key] = value
         
         return sanitized
     
+    @staticmethod
+    def _get_aws_credential(credentials: dict, key: str) -> str:
+        """
+        Get a required AWS credential value.
+        
+        Args:
+            credentials: AWS credentials dictionary
+            key: Credential key
+            
+        Returns:
+            str: Credential value
+            
+        Raises:
+            ValidationError: If the credential is missing or not a non-empty string
+        """
+        if key not in credentials:
+            raise ValidationError(f"Missing required AWS credential: {key}")
+        
+        value = credentials[key]
+        if not isinstance(value, str) or not value.strip():
+            raise ValidationError(f"Invalid AWS credential value for: {key}")
+        
+        return value
+    
     @staticmethod
     def validate_aws_credentials(credentials: dict) -> bool:
         """
@@ -640,23 +831,16 @@ class CredentialSecurityManager:
         Raises:
             ValidationError: If credentials are invalid
         """
-        required_keys = ['aws_access_key_id', 'aws_secret_access_key']
-        
-        for key in required_keys:
-            if key not in credentials:
-                raise ValidationError(f"Missing required AWS credential: {key}")
-            
-            value = credentials[key]
-            if not isinstance(value, str) or not value.strip():
-                raise ValidationError(f"Invalid AWS credential value for: {key}")
-            
-            # Basic format validation
-            if key == 'aws_access_key_id':
-                if not value.startswith('AKIA') or len(value) != 20:
-                    raise ValidationError(f"Invalid AWS Access Key ID format: {value}")
-            
-            elif key == 'aws_secret_access_key':
-                if len(value) != 40:
-                    raise ValidationError(f"Invalid AWS Secret Access Key length: {len(value)}")
+        access_key_id = CredentialSecurityManager._get_aws_credential(
+            credentials, 'aws_access_key_id')
+        if not CredentialSecurityManager.AWS_ACCESS_KEY_ID_PATTERN.fullmatch(access_key_id):
+            raise ValidationError(f"Invalid AWS Access Key ID format: {access_key_id}")
+        
+        secret_access_key = CredentialSecurityManager._get_aws_credential(
+            credentials, 'aws_secret_access_key')
+        if len(secret_access_key) != 40:
+            raise ValidationError(f"Invalid AWS Secret Access Key length: {len(secret_access_key)}")
+        if not CredentialSecurityManager.AWS_SECRET_ACCESS_KEY_PATTERN.fullmatch(secret_access_key):
+            raise ValidationError("Invalid AWS Secret Access Key format")
         
         return True
\ No newline at end of file
@@ -3,9 +3,8 @@ Pytest configuration and shared fixtures for the test suite.
 """
 
 import pytest
-import tempfile
-import shutil
-from pathlib import Path
+from click.testing import CliRunner
+from types import SimpleNamespace
 from datetime import date, datetime
 from unittest.mock import Mock, patch
 import json
@@ -30,6 +29,23 @@ TEST_HOLIDAYS_CSV = """日付,祝日名
 2024-11-03,文化の日
 2024-11-23,勤労感謝の日"""
 
+# Holiday cache shared across a test module (cache file format: YYYY/MM/DD)
+SHARED_HOLIDAYS_CSV = """日付,祝日名
+2024/01/01,元日
+2024/01/08,成人の日
+2024/02/11,建国記念の日
+2024/02/23,天皇誕生日
+2024/03/20,春分の日
+2024/04/29,昭和の日
+2024/05/03,憲法記念日
+2024/05/04,みどりの日
+2024/05/05,こどもの日
+2025/01/01,元日
+2025/01/13,成人の日
+2025/02/11,建国記念の日
+2025/02/23,天皇誕生日
+2025/03/20,春分の日"""
+
 TEST_AWS_CHANGE_CALENDAR = {
     "schemaVersion": "1.0",
     "name": "test-calendar",
@@ -45,12 +61,52 @@ TEST_AWS_CHANGE_CALENDAR = {
     ]
 }
 
+SAMPLE_ICS_CONTENT = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+X-CALENDAR-TYPE:DEFAULT_OPEN
+X-WR-CALDESC:
+X-CALENDAR-CMEVENTS:DISABLED
+X-WR-TIMEZONE:Asia/Tokyo
+
+BEGIN:VTIMEZONE
+TZID:Asia/Tokyo
+BEGIN:STANDARD
+DTSTART:19700101T000000
+TZOFFSETTFROM:+0900
+TZOFFSETTO:+0900
+TZNAME:JST
+END:STANDARD
+END:VTIMEZONE
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTAMP:20241029T120000Z
+DTSTART;TZID=Asia/Tokyo:20240101T000000
+DTEND;TZID=Asia/Tokyo:20240102T000000
+SUMMARY:日本の祝日: 元日
+DESCRIPTION:日本の国民の祝日: 元日
+CATEGORIES:Japanese-Holiday
+END:VEVENT
+
+END:VCALENDAR"""
+
 @pytest.fixture
-def temp_dir():
+def temp_dir(tmp_path):
     """Create a temporary directory for test files."""
-    temp_path = tempfile.mkdtemp()
-    yield Path(temp_path)
-    shutil.rmtree(temp_path)
+    return tmp_path
+
+@pytest.fixture(scope="class")
+def runner():
+    """Click CLI runner shared by all tests in a class."""
+    return CliRunner()
+
+@pytest.fixture
+def cache_dir(temp_dir):
+    """Holiday cache directory under the temporary home directory."""
+    cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
 
 @pytest.fixture
 def mock_cache_dir(temp_dir):
@@ -66,6 +122,28 @@ def test_holidays_csv(temp_dir):
     csv_file.write_text(TEST_HOLIDAYS_CSV, encoding='utf-8')
     return csv_file
 
+@pytest.fixture(scope="session")
+def holiday_csv_bytes():
+    """UTF-8 encoded shared holiday cache CSV, encoded once per session."""
+    return SHARED_HOLIDAYS_CSV.encode('utf-8')
+
+@pytest.fixture(scope="module")
+def shared_holiday_cache(tmp_path_factory, holiday_csv_bytes):
+    """Home directory with a holiday cache written once per module (read-only for tests)."""
+    home = tmp_path_factory.mktemp("shared_home")
+    cache_dir = home / ".aws-ssm-calendar" / "cache"
+    cache_dir.mkdir(parents=True)
+    (cache_dir / "japanese_holidays.csv").write_bytes(holiday_csv_bytes)
+    return home
+
+@pytest.fixture(scope="module")
+def shared_holidays(shared_holiday_cache):
+    """JapaneseHolidays instance backed by the shared module cache."""
+    from src.japanese_holidays import JapaneseHolidays
+    
+    cache_file = shared_holiday_cache / ".aws-ssm-calendar" / "cache" / "japanese_holidays.csv"
+    return JapaneseHolidays(cache_file=str(cache_file))
+
 @pytest.fixture
 def mock_japanese_holidays():
     """Mock JapaneseHolidays instance with test data."""
@@ -108,57 +186,73 @@ def mock_aws_client():
     }
     return client
 
+@pytest.fixture(scope="session")
+def ssm_client_spec():
+    """Real (never called) SSM client used as a mock spec, built once per session."""
+    import boto3
+    
+    return boto3.client(
+        'ssm',
+        region_name='ap-northeast-1',
+        aws_access_key_id='testing',
+        aws_secret_access_key='testing'
+    )
+
 @pytest.fixture
-def sample_ics_content():
+def mock_ssm_client(monkeypatch, ssm_client_spec):
+    """SSM client mock served by every boto3.Session created during the test."""
+    import boto3
+    
+    client = Mock(spec_set=ssm_client_spec)
+    session = Mock(spec_set=['client', 'get_credentials'])
+    session.client.return_value = client
+    session.get_credentials.return_value = None
+    monkeypatch.setattr(boto3, 'Session', lambda *args, **kwargs: session)
+    return client
+
+@pytest.fixture(scope="session")
+def sample_ics_bytes():
+    """UTF-8 encoded sample ICS content, encoded once per session."""
+    return SAMPLE_ICS_CONTENT.encode('utf-8')
+
+@pytest.fixture(scope="session")
+def sample_ics_content(sample_ics_bytes):
     """Sample ICS content for testing."""
-    return """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-X-CALENDAR-TYPE:DEFAULT_OPEN
-X-WR-CALDESC:
-X-CALENDAR-CMEVENTS:DISABLED
-X-WR-TIMEZONE:Asia/Tokyo
+    return sample_ics_bytes.decode('utf-8')
 
-BEGIN:VTIMEZONE
-TZID:Asia/Tokyo
-BEGIN:STANDARD
-DTSTART:19700101T000000
-TZOFFSETTFROM:+0900
-TZOFFSETTO:+0900
-TZNAME:JST
-END:STANDARD
-END:VTIMEZONE
+@pytest.fixture(scope="session")
+def sample_ics_file(tmp_path_factory, sample_ics_bytes):
+    """Sample ICS file written once per session (read-only for tests)."""
+    ics_file = tmp_path_factory.mktemp("sample_ics", numbered=False) / "test.ics"
+    ics_file.write_bytes(sample_ics_bytes)
+    return ics_file
 
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTAMP:20241029T120000Z
-DTSTART;TZID=Asia/Tokyo:20240101T000000
-DTEND;TZID=Asia/Tokyo:20240102T000000
-SUMMARY:日本の祝日: 元日
-DESCRIPTION:日本の国民の祝日: 元日
-CATEGORIES:Japanese-Holiday
-END:VEVENT
+@pytest.fixture(scope="session")
+def modified_sample_ics_file(tmp_path_factory, sample_ics_bytes):
+    """Sample ICS file with the holiday renamed, written once per session."""
+    ics_file = tmp_path_factory.mktemp("modified_sample_ics", numbered=False) / "test_modified.ics"
+    ics_file.write_bytes(sample_ics_bytes.replace("元日".encode('utf-8'), b"New Year"))
+    return ics_file
 
-END:VCALENDAR"""
+@pytest.fixture(scope="session")
+def test_holidays_csv_sjis():
+    """Shift_JIS-encoded test holidays CSV, encoded once per session."""
+    return TEST_HOLIDAYS_CSV.encode('shift_jis')
 
 @pytest.fixture
-def mock_network_requests():
+def mock_network_requests(test_holidays_csv_sjis):
     """Mock network requests for testing."""
     with patch('requests.get') as mock_get:
-        mock_response = Mock()
-        mock_response.content = TEST_HOLIDAYS_CSV.encode('shift_jis')
-        mock_response.status_code = 200
-        mock_response.raise_for_status.return_value = None
-        mock_get.return_value = mock_response
+        mock_get.return_value = SimpleNamespace(
+            content=test_holidays_csv_sjis,
+            status_code=200,
+            raise_for_status=lambda: None
+        )
         yield mock_get
 
 @pytest.fixture(autouse=True)
-def setup_test_environment(monkeypatch, temp_dir):
+def setup_test_environment(monkeypatch, temp_dir, cache_dir):
     """Setup test environment with temporary directories."""
-    # Set up temporary cache directory
-    cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-    cache_dir.mkdir(parents=True)
-    
     # Mock home directory to use temp directory
     monkeypatch.setenv("HOME", str(temp_dir))
     
@@ -5,35 +5,280 @@ Comprehensive verification of all requirements (要件 1-4, 要件 4.2, 要件 4
 
 import pytest
 import tempfile
+import io
 import os
 import json
+import logging
 import time
+import tracemalloc
 from datetime import date, datetime
-from unittest.mock import patch, Mock
 from pathlib import Path
-from click.testing import CliRunner
 
 from src.japanese_holidays import JapaneseHolidays
 from src.ics_generator import ICSGenerator
-from src.calendar_analyzer import ICSAnalyzer
+from src.calendar_analyzer import ICSAnalyzer, ICSAnalysisError
 from src.aws_client import SSMChangeCalendarClient
 from src.change_calendar_manager import ChangeCalendarManager
 from src.cli import cli
 from src.config import Config
 from src.error_handler import BaseApplicationError
 from src.logging_config import setup_logging, LogLevel, LogFormat
+from src.security import SecureFileHandler
+
+# Static ICS documents shared by the requirement tests
+_ICS_ANALYSIS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+X-CALENDAR-TYPE:DEFAULT_OPEN
+X-WR-TIMEZONE:Asia/Tokyo
+
+BEGIN:VTIMEZONE
+TZID:Asia/Tokyo
+BEGIN:STANDARD
+DTSTART:19700101T000000
+TZOFFSETTFROM:+0900
+TZOFFSETTO:+0900
+TZNAME:JST
+END:STANDARD
+END:VTIMEZONE
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;TZID=Asia/Tokyo:20240101T000000
+DTEND;TZID=Asia/Tokyo:20240102T000000
+SUMMARY:日本の祝日: 元日
+DESCRIPTION:日本の国民の祝日: 元日
+CATEGORIES:Japanese-Holiday
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240211@aws-ssm-change-calendar
+DTSTART;TZID=Asia/Tokyo:20240211T000000
+DTEND;TZID=Asia/Tokyo:20240212T000000
+SUMMARY:日本の祝日: 建国記念の日
+DESCRIPTION:日本の国民の祝日: 建国記念の日
+CATEGORIES:Japanese-Holiday
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240223@aws-ssm-change-calendar
+DTSTART;TZID=Asia/Tokyo:20240223T000000
+DTEND;TZID=Asia/Tokyo:20240224T000000
+SUMMARY:日本の祝日: 天皇誕生日
+DESCRIPTION:日本の国民の祝日: 天皇誕生日
+CATEGORIES:Japanese-Holiday
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_BASE = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:元日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240211@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240211
+DTEND;VALUE=DATE:20240212
+SUMMARY:建国記念の日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_UPDATED = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:元日
+DESCRIPTION:国民の祝日（更新版）
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240223@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240223
+DTEND;VALUE=DATE:20240224
+SUMMARY:天皇誕生日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_MODIFIED = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:元日
+DESCRIPTION:国民の祝日（更新）
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240211@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240212
+DTEND;VALUE=DATE:20240213
+SUMMARY:建国記念の日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240223@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240223
+DTEND;VALUE=DATE:20240224
+SUMMARY:天皇誕生日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_AWS = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:元日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_LOCAL = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+
+BEGIN:VEVENT
+UID:jp-holiday-20240101@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:元日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+BEGIN:VEVENT
+UID:jp-holiday-20240223@aws-ssm-change-calendar
+DTSTART;VALUE=DATE:20240223
+DTEND;VALUE=DATE:20240224
+SUMMARY:天皇誕生日
+DESCRIPTION:国民の祝日
+END:VEVENT
+
+END:VCALENDAR"""
+
+_ICS_CLI = """BEGIN:VCALENDAR
+VERSION:2.0
+PRODID:-//AWS//Change Calendar 1.0//EN
+BEGIN:VEVENT
+UID:test-event@cli-test
+DTSTART;VALUE=DATE:20240101
+DTEND;VALUE=DATE:20240102
+SUMMARY:テストイベント
+END:VEVENT
+END:VCALENDAR"""
+
+# Pre-encoded UTF-8 test files
+_CLI_ICS_BYTES = _ICS_CLI.encode('utf-8')
+_CLI_ICS_RENAMED_BYTES = _ICS_CLI.replace('テストイベント', 'テストイベント2').encode('utf-8')
+
+# Holiday cache including Sunday holidays (2025-02-23, 2025-05-04)
+_SUNDAY_HOLIDAYS_CSV_BYTES = """日付,祝日名
+2024-01-01,元日
+2024-02-11,建国記念の日
+2024-02-23,天皇誕生日
+2024-05-05,こどもの日
+2025-02-23,天皇誕生日
+2025-05-04,みどりの日""".encode('utf-8')
+
+# Smallest calendar the analyzer accepts (no properties, no events)
+_MINIMAL_ICS = "BEGIN:VCALENDAR\nEND:VCALENDAR"
+_MINIMAL_ICS_BYTES = _MINIMAL_ICS.encode('utf-8')
+
+_SINGLE_HOLIDAY_CSV_BYTES = "日付,祝日名\n2024-01-01,元日".encode('utf-8')
+
+
+def _fast_write(path: Path, data: bytes) -> None:
+    """Write a tiny payload owner-only (0o600) without the buffered file layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+
+
+@pytest.fixture(scope="session")
+def vcalendar_blobs():
+    """UTF-8 encoded ICS documents, encoded once per session."""
+    return {
+        "analysis": _ICS_ANALYSIS.encode('utf-8'),
+        "base": _ICS_BASE.encode('utf-8'),
+        "updated": _ICS_UPDATED.encode('utf-8'),
+        "modified": _ICS_MODIFIED.encode('utf-8'),
+        "local": _ICS_LOCAL.encode('utf-8'),
+    }
+
+
+@pytest.fixture(scope="session")
+def logging_manager(tmp_path_factory):
+    """Logging manager configured once per session, torn down afterwards."""
+    root_logger = logging.getLogger()
+    original_handlers = root_logger.handlers[:]
+    original_level = root_logger.level
+    manager = setup_logging(
+        log_dir=str(tmp_path_factory.mktemp("logs")),
+        log_level=LogLevel.INFO,
+        log_format=LogFormat.SIMPLE,
+        enable_performance_monitoring=True,
+        enable_system_monitoring=True,
+        debug_mode=False
+    )
+    yield manager
+    manager.cleanup()
+    # setup_logging replaces the root handlers; swap ours back for the originals
+    for handler in root_logger.handlers[:]:
+        if handler not in original_handlers:
+            root_logger.removeHandler(handler)
+            handler.close()
+    for handler in original_handlers:
+        if handler not in root_logger.handlers:
+            root_logger.addHandler(handler)
+    root_logger.setLevel(original_level)
+
+
+@pytest.fixture(scope="session")
+def large_holiday_csv_bytes():
+    """UTF-8 encoded 144-row holiday cache CSV for the performance test."""
+    lines = ["日付,祝日名"]
+    lines.extend(
+        f"{year}-{month:02d}-{day:02d},テスト祝日{year}{month:02d}{day:02d}"
+        for year in range(2024, 2030)
+        for month in range(1, 13)
+        for day in (1, 15)
+    )
+    return "\n".join(lines).encode('utf-8')
 
 
 class TestFinalIntegrationVerification:
     """Final integration verification for all requirements."""
 
-    def setup_method(self):
-        """Setup test environment."""
-        self.runner = CliRunner()
-
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_requirement_1_japanese_holidays_integration(self, temp_dir, monkeypatch):
+    def test_requirement_1_japanese_holidays_integration(self, shared_holidays):
         """
         要件1統合検証: 日本祝日データ取得・管理
         - 一次ソースからの取得
@@ -42,30 +287,8 @@ class TestFinalIntegrationVerification:
         - キャッシュ管理
         - データインテグリティ
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
-        # Test 1: Cache creation and UTF-8 handling
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
-        cache_file = cache_dir / "japanese_holidays.csv"
-        
-        # Test UTF-8 encoding with Japanese characters
-        holiday_data = """日付,祝日名
-2024-01-01,元日
-2024-01-08,成人の日
-2024-02-11,建国記念の日
-2024-02-23,天皇誕生日
-2024-03-20,春分の日
-2024-04-29,昭和の日
-2024-05-03,憲法記念日
-2024-05-04,みどりの日
-2024-05-05,こどもの日
-2025-01-01,元日
-2025-01-13,成人の日"""
-        cache_file.write_text(holiday_data, encoding='utf-8')
-        
-        # Test 2: Holiday data processing
-        holidays = JapaneseHolidays()
+        # Test 1-2: Cache loading and UTF-8 handling (shared session cache data)
+        holidays = shared_holidays
         
         # Verify cache loading
         assert holidays.is_cache_valid()
@@ -86,17 +309,15 @@ class TestFinalIntegrationVerification:
         holidays_2025 = holidays.get_holidays_by_year(2025)
         
         assert len(holidays_2024) == 9  # 9 holidays in test data for 2024
-        assert len(holidays_2025) == 2  # 2 holidays in test data for 2025
+        assert len(holidays_2025) == 5  # 5 holidays in test data for 2025
         
         # Test 5: Data integrity
         assert all(isinstance(h[0], date) for h in holidays_2024)
         assert all(isinstance(h[1], str) for h in holidays_2024)
-        
-        print("✅ 要件1 (Japanese Holidays) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_requirement_2_ics_generation_integration(self, temp_dir, monkeypatch):
+    def test_requirement_2_ics_generation_integration(self, temp_dir, cache_dir):
         """
         要件2統合検証: AWS SSM Change Calendar用ICS変換
         - AWS SSM仕様準拠
@@ -106,22 +327,11 @@ class TestFinalIntegrationVerification:
         - AWS SSM互換性
         - 日曜祝日フィルタリング
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
         # Setup test data with Sunday holidays
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
         cache_file = cache_dir / "japanese_holidays.csv"
         
         # Include Sunday holidays for filtering test
-        holiday_data = """日付,祝日名
-2024-01-01,元日
-2024-02-11,建国記念の日
-2024-02-23,天皇誕生日
-2024-05-05,こどもの日
-2025-02-23,天皇誕生日
-2025-05-04,みどりの日"""  # Sunday holidays for testing
-        cache_file.write_text(holiday_data, encoding='utf-8')
+        cache_file.write_bytes(_SUNDAY_HOLIDAYS_CSV_BYTES)
         
         holidays = JapaneseHolidays()
         
@@ -178,12 +388,10 @@ class TestFinalIntegrationVerification:
         file_content = output_file.read_text(encoding='utf-8')
         assert '元日' in file_content
         assert 'BEGIN:VCALENDAR' in file_content
-        
-        print("✅ 要件2 (ICS Generation) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_requirement_3_ics_analysis_integration(self, temp_dir, monkeypatch):
+    def test_requirement_3_ics_analysis_integration(self, temp_dir, vcalendar_blobs):
         """
         要件3統合検証: ICSファイル解析・可視化
         - ICS解析機能
@@ -193,56 +401,9 @@ class TestFinalIntegrationVerification:
         - 複数形式対応
         - 簡易出力形式
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
         # Create test ICS file with comprehensive content
-        test_ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-X-CALENDAR-TYPE:DEFAULT_OPEN
-X-WR-TIMEZONE:Asia/Tokyo
-
-BEGIN:VTIMEZONE
-TZID:Asia/Tokyo
-BEGIN:STANDARD
-DTSTART:19700101T000000
-TZOFFSETTFROM:+0900
-TZOFFSETTO:+0900
-TZNAME:JST
-END:STANDARD
-END:VTIMEZONE
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;TZID=Asia/Tokyo:20240101T000000
-DTEND;TZID=Asia/Tokyo:20240102T000000
-SUMMARY:日本の祝日: 元日
-DESCRIPTION:日本の国民の祝日: 元日
-CATEGORIES:Japanese-Holiday
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240211@aws-ssm-change-calendar
-DTSTART;TZID=Asia/Tokyo:20240211T000000
-DTEND;TZID=Asia/Tokyo:20240212T000000
-SUMMARY:日本の祝日: 建国記念の日
-DESCRIPTION:日本の国民の祝日: 建国記念の日
-CATEGORIES:Japanese-Holiday
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240223@aws-ssm-change-calendar
-DTSTART;TZID=Asia/Tokyo:20240223T000000
-DTEND;TZID=Asia/Tokyo:20240224T000000
-SUMMARY:日本の祝日: 天皇誕生日
-DESCRIPTION:日本の国民の祝日: 天皇誕生日
-CATEGORIES:Japanese-Holiday
-END:VEVENT
-
-END:VCALENDAR"""
-        
         test_ics_file = temp_dir / "test_analysis.ics"
-        test_ics_file.write_text(test_ics_content, encoding='utf-8')
+        test_ics_file.write_bytes(vcalendar_blobs["analysis"])
         
         # Test 1: ICS parsing and analysis
         analyzer = ICSAnalyzer()
@@ -264,9 +425,10 @@ END:VCALENDAR"""
         assert len(events) == 3
         
         # Verify event properties
-        new_year_event = next((e for e in events if '元日' in e['summary']), None)
+        events_by_uid = {e['uid']: e for e in events}
+        new_year_event = events_by_uid.get('jp-holiday-20240101@aws-ssm-change-calendar')
         assert new_year_event is not None
-        assert new_year_event['uid'] == 'jp-holiday-20240101@aws-ssm-change-calendar'
+        assert '元日' in new_year_event['summary']
         assert 'Japanese-Holiday' in new_year_event['categories']
         
         # Test 3: Statistics generation
@@ -303,19 +465,14 @@ END:VCALENDAR"""
         
         # Test 7: Error detection (test with invalid ICS)
         invalid_ics = temp_dir / "invalid.ics"
-        invalid_ics.write_text("This is not a valid ICS file", encoding='utf-8')
+        invalid_ics.write_bytes(b"This is not a valid ICS file")
         
-        try:
+        with pytest.raises(ICSAnalysisError):
             analyzer.parse_ics_file(str(invalid_ics))
-            assert False, "Should have raised an exception for invalid ICS"
-        except Exception:
-            pass  # Expected behavior
-        
-        print("✅ 要件3 (ICS Analysis) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_requirement_4_ics_comparison_integration(self, temp_dir):
+    def test_requirement_4_ics_comparison_integration(self, temp_dir, vcalendar_blobs):
         """
         要件4統合検証: ICSファイル比較・差分表示
         - ファイル比較機能
@@ -325,55 +482,11 @@ END:VCALENDAR"""
         - サマリー情報
         """
         # Create two ICS files with differences
-        ics_content_1 = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240211@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240211
-DTEND;VALUE=DATE:20240212
-SUMMARY:建国記念の日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
-        ics_content_2 = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日（更新版）
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240223@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240223
-DTEND;VALUE=DATE:20240224
-SUMMARY:天皇誕生日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
         file1 = temp_dir / "calendar_v1.ics"
         file2 = temp_dir / "calendar_v2.ics"
         
-        file1.write_text(ics_content_1, encoding='utf-8')
-        file2.write_text(ics_content_2, encoding='utf-8')
+        file1.write_bytes(vcalendar_blobs["base"])
+        file2.write_bytes(vcalendar_blobs["updated"])
         
         # Test 1: File comparison
         analyzer = ICSAnalyzer()
@@ -416,12 +529,10 @@ END:VCALENDAR"""
             dates = [event.get('dtstart') for event in added_events if event.get('dtstart')]
             if len(dates) > 1:
                 assert dates == sorted(dates)
-        
-        print("✅ 要件4 (ICS Comparison) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_requirement_4_2_semantic_diff_integration(self, temp_dir):
+    def test_requirement_4_2_semantic_diff_integration(self, temp_dir, vcalendar_blobs):
         """
         要件4.2統合検証: イベント意味的Diff形式比較表示
         - イベント意味的比較
@@ -432,63 +543,11 @@ END:VCALENDAR"""
         - カラー出力
         """
         # Create ICS files for semantic diff testing
-        ics_content_base = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240211@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240211
-DTEND;VALUE=DATE:20240212
-SUMMARY:建国記念の日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
-        ics_content_modified = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日（更新）
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240211@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240212
-DTEND;VALUE=DATE:20240213
-SUMMARY:建国記念の日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240223@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240223
-DTEND;VALUE=DATE:20240224
-SUMMARY:天皇誕生日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
         file_base = temp_dir / "semantic_base.ics"
         file_modified = temp_dir / "semantic_modified.ics"
         
-        file_base.write_text(ics_content_base, encoding='utf-8')
-        file_modified.write_text(ics_content_modified, encoding='utf-8')
+        file_base.write_bytes(vcalendar_blobs["base"])
+        file_modified.write_bytes(vcalendar_blobs["modified"])
         
         analyzer = ICSAnalyzer()
         
@@ -519,13 +578,10 @@ END:VCALENDAR"""
                 # Test with color
                 colored_diff = analyzer.format_semantic_diff(diff_result, use_color=True)
                 assert isinstance(colored_diff, str)
-        
-        print("✅ 要件4.2 (Semantic Diff) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    @patch('boto3.Session')
-    def test_requirement_4_3_aws_integration(self, mock_session, temp_dir, monkeypatch):
+    def test_requirement_4_3_aws_integration(self, mock_ssm_client, temp_dir, vcalendar_blobs):
         """
         要件4.3統合検証: AWS Change Calendar統合比較
         - AWS Change Calendar取得
@@ -534,28 +590,12 @@ END:VCALENDAR"""
         - AWS専用出力
         - バッチ比較
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
         # Mock AWS responses
-        mock_client = Mock()
+        mock_client = mock_ssm_client
         
         # Mock ICS content from AWS
-        aws_ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
         mock_client.get_document.return_value = {
-            'Content': aws_ics_content,
+            'Content': _ICS_AWS,
             'DocumentVersion': '1',
             'DocumentFormat': 'TEXT'
         }
@@ -581,8 +621,6 @@ END:VCALENDAR"""
             ]
         }
         
-        mock_session.return_value.client.return_value = mock_client
-        
         # Test 1: AWS Change Calendar Manager integration
         manager = ChangeCalendarManager(region_name='ap-northeast-1')
         
@@ -598,30 +636,8 @@ END:VCALENDAR"""
         assert analysis['aws_info']['region'] == 'ap-northeast-1'
         
         # Test 3: Calendar comparison with local ICS
-        local_ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-
-BEGIN:VEVENT
-UID:jp-holiday-20240101@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:元日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-BEGIN:VEVENT
-UID:jp-holiday-20240223@aws-ssm-change-calendar
-DTSTART;VALUE=DATE:20240223
-DTEND;VALUE=DATE:20240224
-SUMMARY:天皇誕生日
-DESCRIPTION:国民の祝日
-END:VEVENT
-
-END:VCALENDAR"""
-        
         local_ics_file = temp_dir / "local_calendar.ics"
-        local_ics_file.write_text(local_ics_content, encoding='utf-8')
+        local_ics_file.write_bytes(vcalendar_blobs["local"])
         
         # Test AWS vs local comparison (if implemented)
         if hasattr(manager, 'compare_with_local_ics'):
@@ -634,12 +650,10 @@ END:VCALENDAR"""
         comparison = manager.compare_calendars(['test-aws-calendar'])
         assert 'calendars' in comparison
         assert 'individual_analyses' in comparison
-        
-        print("✅ 要件4.3 (AWS Integration) integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_cli_integration_all_commands(self, temp_dir, monkeypatch):
+    def test_cli_integration_all_commands(self, runner, temp_dir, shared_holiday_cache, monkeypatch):
         """
         CLI統合検証: 全コマンドの動作確認
         - デフォルト設定の動作
@@ -647,70 +661,47 @@ END:VCALENDAR"""
         - ログ機能
         - パフォーマンス監視
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
-        # Setup test data
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
-        cache_file = cache_dir / "japanese_holidays.csv"
-        
-        holiday_data = """日付,祝日名
-2024-01-01,元日
-2024-02-11,建国記念の日
-2024-02-23,天皇誕生日"""
-        cache_file.write_text(holiday_data, encoding='utf-8')
+        # Setup test data: every command loads holidays from the shared module cache
+        monkeypatch.setenv('HOME', str(shared_holiday_cache))
         
         # Test 1: holidays command with default settings
-        result = self.runner.invoke(cli, ['holidays', '--year', '2024'])
+        result = runner.invoke(cli, ['holidays', '--year', '2024'])
         assert result.exit_code == 0
         assert '元日' in result.output
         assert '建国記念の日' in result.output
         
         # Test 2: check-holiday command
-        result = self.runner.invoke(cli, ['check-holiday', '--date', '2024-01-01'])
+        result = runner.invoke(cli, ['check-holiday', '--date', '2024-01-01'])
         assert result.exit_code == 0
         assert '元日' in result.output
         
         # Test 3: analyze-ics command
         test_ics = temp_dir / "test_cli.ics"
-        test_ics_content = """BEGIN:VCALENDAR
-VERSION:2.0
-PRODID:-//AWS//Change Calendar 1.0//EN
-BEGIN:VEVENT
-UID:test-event@cli-test
-DTSTART;VALUE=DATE:20240101
-DTEND;VALUE=DATE:20240102
-SUMMARY:テストイベント
-END:VEVENT
-END:VCALENDAR"""
-        test_ics.write_text(test_ics_content, encoding='utf-8')
+        test_ics.write_bytes(_CLI_ICS_BYTES)
         
-        result = self.runner.invoke(cli, ['analyze-ics', str(test_ics)])
+        result = runner.invoke(cli, ['analyze-ics', str(test_ics)])
         assert result.exit_code == 0
         assert 'カレンダー解析結果' in result.output
         
         # Test 4: compare-ics command
         test_ics2 = temp_dir / "test_cli2.ics"
-        test_ics2_content = test_ics_content.replace('テストイベント', 'テストイベント2')
-        test_ics2.write_text(test_ics2_content, encoding='utf-8')
+        test_ics2.write_bytes(_CLI_ICS_RENAMED_BYTES)
         
-        result = self.runner.invoke(cli, ['compare-ics', str(test_ics), str(test_ics2)])
+        result = runner.invoke(cli, ['compare-ics', str(test_ics), str(test_ics2)])
         assert result.exit_code == 0
         assert '比較結果' in result.output
         
         # Test 5: Error handling
-        result = self.runner.invoke(cli, ['analyze-ics', 'nonexistent.ics'])
+        result = runner.invoke(cli, ['analyze-ics', 'nonexistent.ics'])
         assert result.exit_code != 0
         
         # Test 6: Verbose logging
-        result = self.runner.invoke(cli, ['--log-level', 'INFO', 'holidays', '--year', '2024'])
+        result = runner.invoke(cli, ['--log-level', 'INFO', 'holidays', '--year', '2024'])
         assert result.exit_code == 0
-        
-        print("✅ CLI integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_error_handling_integration(self, temp_dir, monkeypatch):
+    def test_error_handling_integration(self, temp_dir, cache_dir):
         """
         エラーハンドリング統合検証
         - 適切なエラー分類
@@ -718,8 +709,6 @@ END:VCALENDAR"""
         - ログ記録
         - 回復メカニズム
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
         # Test 1: File not found error
         analyzer = ICSAnalyzer()
         try:
@@ -730,29 +719,22 @@ END:VCALENDAR"""
         
         # Test 2: Invalid ICS format error
         invalid_ics = temp_dir / "invalid.ics"
-        invalid_ics.write_text("Not an ICS file", encoding='utf-8')
+        invalid_ics.write_bytes(b"Not an ICS file")
         
-        try:
+        with pytest.raises(ICSAnalysisError):
             analyzer.parse_ics_file(str(invalid_ics))
-            assert False, "Should raise an exception for invalid ICS"
-        except Exception:
-            pass  # Expected
         
         # Test 3: Cache handling with invalid data
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
         cache_file = cache_dir / "japanese_holidays.csv"
-        cache_file.write_text("invalid,csv,format", encoding='utf-8')
+        cache_file.write_bytes(b"invalid,csv,format")
         
         # Should handle gracefully
         holidays = JapaneseHolidays()
         # Should not crash, may have empty data
-        
-        print("✅ Error handling integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_performance_optimization_integration(self, temp_dir, monkeypatch):
+    def test_performance_optimization_integration(self, cache_dir, large_holiday_csv_bytes):
         """
         パフォーマンス最適化統合検証
         - メモリ効率
@@ -760,21 +742,9 @@ END:VCALENDAR"""
         - 処理速度
         - リソース使用量
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
-        # Setup large test dataset
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
+        # Setup large test dataset (built once per session)
         cache_file = cache_dir / "japanese_holidays.csv"
-        
-        # Generate large dataset for performance testing
-        large_data = "日付,祝日名\n"
-        for year in range(2024, 2030):
-            for month in range(1, 13):
-                for day in [1, 15]:
-                    large_data += f"{year}-{month:02d}-{day:02d},テスト祝日{year}{month:02d}{day:02d}\n"
-        
-        cache_file.write_text(large_data, encoding='utf-8')
+        cache_file.write_bytes(large_holiday_csv_bytes)
         
         # Test 1: Cache performance
         start_time = time.time()
@@ -791,27 +761,30 @@ END:VCALENDAR"""
         
         assert generation_time < 2.0, f"ICS generation took {generation_time:.2f}s, expected < 2.0s"
         
-        # Test 3: Memory efficiency
-        import psutil
-        process = psutil.Process()
-        memory_before = process.memory_info().rss / 1024 / 1024  # MB
+        # Test 3: Memory efficiency (Python allocations, not process RSS)
+        was_tracing = tracemalloc.is_tracing()
+        if not was_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        memory_before, _ = tracemalloc.get_traced_memory()
         
-        # Perform multiple operations
-        for _ in range(5):
+        # Repeat the lookups once; unchanged calendars reuse the generated content
+        try:
             holidays.get_stats()
             holidays.is_holiday(date(2024, 1, 1))
-            ics_generator.generate_ics_content()
+            assert ics_generator.generate_ics_content() is ics_content
+            _, memory_peak = tracemalloc.get_traced_memory()
+        finally:
+            if not was_tracing:
+                tracemalloc.stop()
         
-        memory_after = process.memory_info().rss / 1024 / 1024  # MB
-        memory_growth = memory_after - memory_before
+        memory_growth = (memory_peak - memory_before) / 1024 / 1024  # MB
         
         assert memory_growth < 50, f"Memory grew by {memory_growth:.2f}MB, expected < 50MB"
-        
-        print("✅ Performance optimization integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_logging_and_monitoring_integration(self, temp_dir):
+    def test_logging_and_monitoring_integration(self, logging_manager, monkeypatch):
         """
         ログ・モニタリング統合検証
         - ログレベル制御
@@ -819,20 +792,19 @@ END:VCALENDAR"""
         - システムメトリクス
         - デバッグ機能
         """
-        # Test 1: Logging setup with different levels
-        logging_manager = setup_logging(
-            log_level=LogLevel.INFO,
-            log_format=LogFormat.SIMPLE,
-            enable_performance_monitoring=True,
-            enable_system_monitoring=True,
-            debug_mode=False
-        )
-        
+        # Test 1: Logging setup (configured once per session)
         assert logging_manager is not None
         
-        # Test 2: Performance monitoring
-        with logging_manager.monitor_operation("test_operation", {"test": "data"}):
-            time.sleep(0.1)  # Simulate work
+        # Test 2: Performance monitoring (fake clock instead of a real sleep)
+        clock = [1000.0]
+        with monkeypatch.context() as m:
+            m.setattr(time, 'time', lambda: clock[0])
+            with logging_manager.monitor_operation("test_operation", {"test": "data"}):
+                clock[0] += 0.1  # Simulate work
+        
+        summary = logging_manager.get_performance_summary("test_operation")
+        assert summary['total_operations'] == 1
+        assert summary['duration_stats']['max'] == pytest.approx(0.1)
         
         # Test 3: System metrics (if available)
         try:
@@ -842,36 +814,16 @@ END:VCALENDAR"""
                 assert hasattr(metrics, 'memory_percent')
         except Exception:
             pass  # System metrics may not be available in all environments
-        
-        print("✅ Logging and monitoring integration verified")
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_end_to_end_workflow_integration(self, temp_dir, monkeypatch):
+    def test_end_to_end_workflow_integration(self, temp_dir, shared_holidays):
         """
         エンドツーエンドワークフロー統合検証
         全要件を組み合わせた完全なワークフロー
         """
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
-        # Setup
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
-        cache_file = cache_dir / "japanese_holidays.csv"
-        
-        holiday_data = """日付,祝日名
-2024-01-01,元日
-2024-02-11,建国記念の日
-2024-02-23,天皇誕生日
-2024-03-20,春分の日
-2024-04-29,昭和の日
-2024-05-03,憲法記念日
-2024-05-04,みどりの日
-2024-05-05,こどもの日"""
-        cache_file.write_text(holiday_data, encoding='utf-8')
-        
         # Step 1: Load Japanese holidays (要件1)
-        holidays = JapaneseHolidays()
+        holidays = shared_holidays
         assert holidays.is_holiday(date(2024, 1, 1))
         
         # Step 2: Generate ICS file (要件2)
@@ -898,10 +850,8 @@ END:VCALENDAR"""
         human_readable = analyzer.format_human_readable(analysis)
         comparison_result = analyzer.format_comparison_result(comparison)
         
-        assert len(human_readable) > 0
-        assert len(comparison_result) > 0
-        
-        print("✅ End-to-end workflow integration verified")
+        assert human_readable
+        assert comparison_result
 
 
 class TestSecurityIntegration:
@@ -909,50 +859,43 @@ class TestSecurityIntegration:
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_input_validation_integration(self, temp_dir):
+    def test_input_validation_integration(self, shared_holidays):
         """Test input validation across all components."""
         # Test 1: Date validation
-        holidays = JapaneseHolidays()
+        holidays = shared_holidays
         
         # Valid date
         assert isinstance(holidays.is_holiday(date(2024, 1, 1)), bool)
         
-        # Test 2: File path validation
+        # Test 2: Content parsing without a file
         analyzer = ICSAnalyzer()
+        analysis = analyzer.parse_ics_stream(io.StringIO(_MINIMAL_ICS))
+        assert analysis['file_info']['total_events'] == 0
+
+    @pytest.mark.integration
+    @pytest.mark.final_verification
+    @pytest.mark.parametrize("relpath", ["test.ics", "subdir/test.ics"])
+    def test_file_path_validation_integration(self, temp_dir, relpath):
+        """Test ICS file paths are accepted by the analyzer."""
+        path = temp_dir / relpath
+        path.parent.mkdir(exist_ok=True)
+        _fast_write(path, _MINIMAL_ICS_BYTES)
         
-        # Test with various file paths
-        valid_paths = [
-            temp_dir / "test.ics",
-            temp_dir / "subdir" / "test.ics"
-        ]
-        
-        for path in valid_paths:
-            path.parent.mkdir(parents=True, exist_ok=True)
-            path.write_text("BEGIN:VCALENDAR\nEND:VCALENDAR", encoding='utf-8')
-            
-            try:
-                analyzer.parse_ics_file(str(path))
-            except Exception:
-                pass  # May fail due to invalid content, but path should be accepted
+        analysis = ICSAnalyzer().parse_ics_file(str(path))
         
-        print("✅ Input validation integration verified")
+        assert analysis['file_info']['filepath'] == str(path)
 
     @pytest.mark.integration
     @pytest.mark.final_verification
-    def test_file_security_integration(self, temp_dir, monkeypatch):
+    def test_file_security_integration(self, temp_dir, cache_dir):
         """Test file security measures."""
-        monkeypatch.setenv('HOME', str(temp_dir))
-        
         # Test 1: Cache file permissions
-        cache_dir = temp_dir / ".aws-ssm-calendar" / "cache"
-        cache_dir.mkdir(parents=True)
         cache_file = cache_dir / "japanese_holidays.csv"
         
-        holiday_data = "日付,祝日名\n2024-01-01,元日"
-        cache_file.write_text(holiday_data, encoding='utf-8')
+        SecureFileHandler.write_secure_file(cache_file, _SINGLE_HOLIDAY_CSV_BYTES.decode('utf-8'))
         
-        # Verify file was created
-        assert cache_file.exists()
+        # Verify the product writer left the file readable by the owner only
+        assert cache_file.stat().st_mode & 0o777 == SecureFileHandler.SECURE_FILE_PERMISSIONS
         
         # Test 2: Output file security
         ics_generator = ICSGenerator()
@@ -960,8 +903,6 @@ class TestSecurityIntegration:
         ics_generator.save_to_file(str(output_file))
         
         assert output_file.exists()
-        
-        print("✅ File security integration verified")
 
 
 def run_final_integration_verification():
@@ -969,29 +910,23 @@ def run_final_integration_verification():
     print("🚀 Starting Final Integration Verification (Task 18.1)")
     print("=" * 60)
     
-    # Run pytest with specific markers
-    import subprocess
-    import sys
-    
-    result = subprocess.run([
-        sys.executable, '-m', 'pytest',
+    # Run pytest in-process with specific markers (no interpreter start-up or re-import)
+    returncode = pytest.main([
         'tests/integration/test_final_integration_verification.py',
         '-m', 'final_verification',
+        '-p', 'no:cacheprovider',  # no --lf/--nf state needed for a one-shot run
+        '--no-header',
         '-v',
         '--tb=short'
-    ], capture_output=True, text=True)
-    
-    print(result.stdout)
-    if result.stderr:
-        print("STDERR:", result.stderr)
+    ])
     
-    if result.returncode == 0:
+    if returncode == 0:
         print("✅ All final integration verification tests passed!")
     else:
         print("❌ Some final integration verification tests failed!")
-        print(f"Exit code: {result.returncode}")
+        print(f"Exit code: {int(returncode)}")
     
-    return result.returncode == 0
+    return returncode == 0
 
 
 if __name__ == '__main__':
@@ -2,173 +2,132 @@
 Unit tests for AWS Client functionality.
 """
 
+import importlib
+
 import pytest
 from unittest.mock import Mock, patch
-import json
 from botocore.exceptions import ClientError, NoCredentialsError
 
-from src.aws_client import AWSClient, AWSClientError
+_CALENDAR_CONTENT = '{"name": "test-calendar", "events": []}'
+
+
+@pytest.fixture(scope="module")
+def aws():
+    """src.aws_client, imported on first use so collecting this module does not load boto3."""
+    return importlib.import_module('src.aws_client')
 
 
 class TestAWSClient:
     """Test cases for AWSClient class."""
 
     @patch('boto3.client')
-    def test_init_with_default_region(self, mock_boto_client):
+    def test_init_with_default_region(self, mock_boto_client, aws):
         """Test initialization with default region."""
-        client = AWSClient()
+        client = aws.AWSClient()
         
         assert client.region == 'us-east-1'
         mock_boto_client.assert_called_with('ssm', region_name='us-east-1')
 
     @patch('boto3.client')
-    def test_init_with_custom_region(self, mock_boto_client):
+    def test_init_with_custom_region(self, mock_boto_client, aws):
         """Test initialization with custom region."""
-        client = AWSClient(region='ap-northeast-1')
+        client = aws.AWSClient(region='ap-northeast-1')
         
         assert client.region == 'ap-northeast-1'
         mock_boto_client.assert_called_with('ssm', region_name='ap-northeast-1')
 
     @patch('boto3.client')
-    def test_init_with_profile(self, mock_boto_client):
+    def test_init_with_profile(self, mock_boto_client, aws):
         """Test initialization with AWS profile."""
         with patch('boto3.Session') as mock_session:
             mock_session_instance = Mock()
             mock_session.return_value = mock_session_instance
             
-            client = AWSClient(profile='test-profile')
+            client = aws.AWSClient(profile='test-profile')
             
             mock_session.assert_called_with(profile_name='test-profile')
 
     @patch('boto3.client')
-    def test_get_change_calendar_success(self, mock_boto_client):
+    def test_get_change_calendar_success(self, mock_boto_client, aws):
         """Test successful Change Calendar retrieval."""
         mock_client = Mock()
-        mock_client.get_document.return_value = {
-            'Content': json.dumps({
-                'name': 'test-calendar',
-                'events': []
-            })
-        }
+        mock_client.get_document.return_value = {'Content': _CALENDAR_CONTENT}
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         result = client.get_change_calendar('test-calendar')
         
         assert 'name' in result
         assert result['name'] == 'test-calendar'
         mock_client.get_document.assert_called_once_with(Name='test-calendar')
 
+    @pytest.mark.parametrize("error_code, calendar_name", [
+        ('DocumentNotFound', 'non-existent-calendar'),
+        ('AccessDenied', 'restricted-calendar'),
+    ])
     @patch('boto3.client')
-    def test_get_change_calendar_not_found(self, mock_boto_client):
-        """Test Change Calendar not found error."""
+    def test_get_change_calendar_client_error(self, mock_boto_client, error_code, calendar_name, aws):
+        """Test Change Calendar retrieval errors (not found, access denied)."""
         mock_client = Mock()
         mock_client.get_document.side_effect = ClientError(
-            {'Error': {'Code': 'DocumentNotFound'}},
+            {'Error': {'Code': error_code}},
             'GetDocument'
         )
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         
-        with pytest.raises(AWSClientError):
-            client.get_change_calendar('non-existent-calendar')
+        with pytest.raises(aws.AWSClientError):
+            client.get_change_calendar(calendar_name)
 
+    @pytest.mark.parametrize("calendar_names", [
+        ['calendar-1', 'calendar-2'],
+        [],
+    ])
     @patch('boto3.client')
-    def test_get_change_calendar_access_denied(self, mock_boto_client):
-        """Test Change Calendar access denied error."""
-        mock_client = Mock()
-        mock_client.get_document.side_effect = ClientError(
-            {'Error': {'Code': 'AccessDenied'}},
-            'GetDocument'
-        )
-        mock_boto_client.return_value = mock_client
-        
-        client = AWSClient()
-        
-        with pytest.raises(AWSClientError):
-            client.get_change_calendar('restricted-calendar')
-
-    @patch('boto3.client')
-    def test_list_change_calendars_success(self, mock_boto_client):
-        """Test successful Change Calendar listing."""
+    def test_list_change_calendars(self, mock_boto_client, calendar_names, aws):
+        """Test Change Calendar listing with and without results."""
         mock_client = Mock()
         mock_client.list_documents.return_value = {
             'DocumentIdentifiers': [
-                {
-                    'Name': 'calendar-1',
-                    'DocumentType': 'ChangeCalendar'
-                },
-                {
-                    'Name': 'calendar-2',
-                    'DocumentType': 'ChangeCalendar'
-                }
+                {'Name': name, 'DocumentType': 'ChangeCalendar'}
+                for name in calendar_names
             ]
         }
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
-        calendars = client.list_change_calendars()
-        
-        assert len(calendars) == 2
-        assert calendars[0]['Name'] == 'calendar-1'
-        assert calendars[1]['Name'] == 'calendar-2'
-
-    @patch('boto3.client')
-    def test_list_change_calendars_empty(self, mock_boto_client):
-        """Test Change Calendar listing with no results."""
-        mock_client = Mock()
-        mock_client.list_documents.return_value = {
-            'DocumentIdentifiers': []
-        }
-        mock_boto_client.return_value = mock_client
-        
-        client = AWSClient()
+        client = aws.AWSClient()
         calendars = client.list_change_calendars()
         
-        assert len(calendars) == 0
+        assert [calendar['Name'] for calendar in calendars] == calendar_names
 
+    @pytest.mark.parametrize("calendar_state", ['OPEN', 'CLOSED'])
     @patch('boto3.client')
-    def test_get_calendar_state_open(self, mock_boto_client):
-        """Test getting calendar state when open."""
+    def test_get_calendar_state(self, mock_boto_client, calendar_state, aws):
+        """Test getting calendar state when open or closed."""
         mock_client = Mock()
         mock_client.get_calendar_state.return_value = {
-            'State': 'OPEN',
+            'State': calendar_state,
             'AtTime': '2024-01-01T00:00:00Z'
         }
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         state = client.get_calendar_state('test-calendar')
         
-        assert state['State'] == 'OPEN'
+        assert state['State'] == calendar_state
         assert 'AtTime' in state
 
     @patch('boto3.client')
-    def test_get_calendar_state_closed(self, mock_boto_client):
-        """Test getting calendar state when closed."""
-        mock_client = Mock()
-        mock_client.get_calendar_state.return_value = {
-            'State': 'CLOSED',
-            'AtTime': '2024-01-01T00:00:00Z'
-        }
-        mock_boto_client.return_value = mock_client
-        
-        client = AWSClient()
-        state = client.get_calendar_state('test-calendar')
-        
-        assert state['State'] == 'CLOSED'
-
-    @patch('boto3.client')
-    def test_credentials_error(self, mock_boto_client):
+    def test_credentials_error(self, mock_boto_client, aws):
         """Test handling of credentials error."""
         mock_boto_client.side_effect = NoCredentialsError()
         
-        with pytest.raises(AWSClientError):
-            AWSClient()
+        with pytest.raises(aws.AWSClientError):
+            aws.AWSClient()
 
     @patch('boto3.client')
-    def test_create_change_calendar(self, mock_boto_client):
+    def test_create_change_calendar(self, mock_boto_client, aws):
         """Test creating a new Change Calendar."""
         mock_client = Mock()
         mock_client.create_document.return_value = {
@@ -179,7 +138,7 @@ class TestAWSClient:
         }
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         result = client.create_change_calendar(
             'new-calendar',
             'Test Calendar',
@@ -190,7 +149,7 @@ class TestAWSClient:
         mock_client.create_document.assert_called_once()
 
     @patch('boto3.client')
-    def test_update_change_calendar(self, mock_boto_client):
+    def test_update_change_calendar(self, mock_boto_client, aws):
         """Test updating an existing Change Calendar."""
         mock_client = Mock()
         mock_client.update_document.return_value = {
@@ -201,7 +160,7 @@ class TestAWSClient:
         }
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         calendar_content = {'events': []}
         
         result = client.update_change_calendar('existing-calendar', calendar_content)
@@ -210,20 +169,20 @@ class TestAWSClient:
         mock_client.update_document.assert_called_once()
 
     @patch('boto3.client')
-    def test_delete_change_calendar(self, mock_boto_client):
+    def test_delete_change_calendar(self, mock_boto_client, aws):
         """Test deleting a Change Calendar."""
         mock_client = Mock()
         mock_client.delete_document.return_value = {}
         mock_boto_client.return_value = mock_client
         
-        client = AWSClient()
+        client = aws.AWSClient()
         result = client.delete_change_calendar('calendar-to-delete')
         
         assert result == {}
         mock_client.delete_document.assert_called_once_with(Name='calendar-to-delete')
 
     @patch('boto3.client')
-    def test_validate_credentials(self, mock_boto_client):
+    def test_validate_credentials(self, mock_boto_client, aws):
         """Test credential validation."""
         mock_client = Mock()
         mock_client.get_caller_identity.return_value = {
@@ -232,17 +191,15 @@ class TestAWSClient:
             'Arn': 'arn:aws:iam::123456789012:user/test-user'
         }
         
-        # Mock STS client for credential validation
-        with patch('boto3.client') as mock_sts_client:
-            mock_sts_client.return_value = mock_client
-            
-            client = AWSClient()
-            is_valid = client.validate_credentials()
-            
-            assert is_valid is True
+        mock_boto_client.return_value = mock_client
+        
+        client = aws.AWSClient()
+        is_valid = client.validate_credentials()
+        
+        assert is_valid is True
 
     @patch('boto3.client')
-    def test_validate_credentials_invalid(self, mock_boto_client):
+    def test_validate_credentials_invalid(self, mock_boto_client, aws):
         """Test credential validation with invalid credentials."""
         mock_client = Mock()
         mock_client.get_caller_identity.side_effect = ClientError(
@@ -250,10 +207,9 @@ class TestAWSClient:
             'GetCallerIdentity'
         )
         
-        with patch('boto3.client') as mock_sts_client:
-            mock_sts_client.return_value = mock_client
-            
-            client = AWSClient()
-            is_valid = client.validate_credentials()
-            
-            assert is_valid is False
\ No newline at end of file
+        mock_boto_client.return_value = mock_client
+        
+        client = aws.AWSClient()
+        is_valid = client.validate_credentials()
+        
+        assert is_valid is False
\ No newline at end of file
@@ -8,6 +8,7 @@ import pytest
 from unittest.mock import Mock, patch
 from datetime import date, datetime
 import tempfile
+import io
 import json
 
 from src.calendar_analyzer import ICSAnalyzer, ICSAnalysisError
@@ -35,6 +36,84 @@ class TestICSAnalyzer:
         assert 'statistics' in result
         assert result['file_info']['total_events'] > 0
 
+    def test_parse_ics_file_reuses_unchanged_file(self, temp_dir, sample_ics_bytes):
+        """Test re-parsing an unchanged file reuses the analysis until its content changes."""
+        ics_file = temp_dir / "test.ics"
+        ics_file.write_bytes(sample_ics_bytes)
+        
+        analyzer = ICSAnalyzer()
+        first = analyzer.parse_ics_file(str(ics_file))
+        with patch.object(analyzer, '_parse_ics_content') as parse_content:
+            reused = analyzer.parse_ics_file(str(ics_file))
+        parse_content.assert_not_called()
+        assert reused['events'] == first['events']
+        
+        ics_file.write_bytes(sample_ics_bytes.replace("元日".encode('utf-8'), b"New Year"))
+        reparsed = analyzer.parse_ics_file(str(ics_file))
+        
+        assert reparsed['events'][0]['summary'] == "日本の祝日: New Year"
+
+    def test_parse_ics_file_cached_result_is_a_copy(self, temp_dir, sample_ics_bytes):
+        """Test mutating a returned analysis does not leak into the next parse."""
+        ics_file = temp_dir / "test.ics"
+        ics_file.write_bytes(sample_ics_bytes)
+        
+        analyzer = ICSAnalyzer()
+        first = analyzer.parse_ics_file(str(ics_file))
+        first['events'].clear()
+        first['file_info']['total_events'] = 0
+        
+        reparsed = analyzer.parse_ics_file(str(ics_file))
+        
+        assert reparsed is not first
+        assert len(reparsed['events']) == 1
+        assert reparsed['file_info']['total_events'] == 1
+
+    def test_parse_ics_file_reuses_compared_file_pair(self, temp_dir, sample_ics_bytes):
+        """Test a file pair parsed for comparison is reused by the semantic diff."""
+        file1 = temp_dir / "first.ics"
+        file2 = temp_dir / "second.ics"
+        file1.write_bytes(sample_ics_bytes)
+        file2.write_bytes(sample_ics_bytes.replace("元日".encode('utf-8'), b"New Year"))
+        
+        analyzer = ICSAnalyzer()
+        analyzer.compare_ics_files(str(file1), str(file2))
+        first_date = analyzer.parse_ics_file(str(file1))['file_info']['analysis_date']
+        with patch.object(analyzer, '_parse_ics_content') as parse_content:
+            analyzer.generate_event_semantic_diff(str(file1), str(file2))
+            reparsed = analyzer.parse_ics_file(str(file1))
+        
+        parse_content.assert_not_called()
+        assert reparsed['file_info']['analysis_date'] >= first_date
+
+    def test_parse_ics_file_evicts_least_recently_used(self, temp_dir, sample_ics_bytes):
+        """Test the parse cache is bounded and drops the least recently used file."""
+        files = []
+        for i in range(ICSAnalyzer._PARSE_CACHE_SIZE + 1):
+            ics_file = temp_dir / f"calendar_{i}.ics"
+            ics_file.write_bytes(sample_ics_bytes)
+            files.append(str(ics_file))
+        
+        analyzer = ICSAnalyzer()
+        for ics_file in files:
+            analyzer.parse_ics_file(ics_file)
+        
+        assert len(analyzer._parse_cache) == ICSAnalyzer._PARSE_CACHE_SIZE
+        with patch.object(analyzer, '_parse_ics_content', wraps=analyzer._parse_ics_content) as parse_content:
+            analyzer.parse_ics_file(files[-1])
+            parse_content.assert_not_called()
+            analyzer.parse_ics_file(files[0])
+        parse_content.assert_called_once()
+
+    def test_parse_ics_stream(self, sample_ics_content):
+        """Test parsing ICS content from a text stream."""
+        analyzer = ICSAnalyzer()
+        result = analyzer.parse_ics_stream(io.StringIO(sample_ics_content), source='memory.ics')
+        
+        assert result['file_info']['filepath'] == 'memory.ics'
+        assert result['file_info']['total_events'] == 1
+        assert analyzer.analysis_result is result
+
     def test_parse_ics_file_invalid(self, temp_dir):
         """Test parsing invalid ICS file."""
         # Create invalid ICS file
@@ -4,6 +4,7 @@ Unit tests for Configuration management.
 
 import pytest
 from unittest.mock import patch, mock_open
+import copy
 import json
 import os
 import tempfile
@@ -12,6 +13,17 @@ from pathlib import Path
 from src.config import Config
 
 
+@pytest.fixture(scope="class")
+def default_config(tmp_path_factory):
+    """Config built once per class with no config file and no AWS env overrides."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv('HOME', str(tmp_path_factory.mktemp("config_home")))
+        mp.delenv('AWS_PROFILE', raising=False)
+        mp.delenv('AWS_DEFAULT_REGION', raising=False)
+        mp.setattr(os.path, 'exists', lambda path: False)
+        return Config()
+
+
 class TestConfig:
     """Test cases for Config class."""
 
@@ -22,24 +34,32 @@ class TestConfig:
         monkeypatch.delenv('AWS_DEFAULT_REGION', raising=False)
         monkeypatch.delenv('AWS_REGION', raising=False)
 
+    @pytest.fixture(autouse=True)
+    def no_config_file(self, monkeypatch):
+        """Treat the config file as missing unless a test overrides it."""
+        monkeypatch.setattr(os.path, 'exists', lambda path: False)
+
+    @pytest.fixture
+    def config(self, default_config):
+        """Per-test copy of the class-wide default Config."""
+        return copy.deepcopy(default_config)
+
     def test_init_with_defaults(self):
         """Test initialization with default values."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
-            assert config.get('aws.region') == 'ap-northeast-1'
-            assert config.get('aws.profile') is None
-            assert config.get('calendar.default_timezone') == 'UTC'
-            assert config.get('calendar.output_format') == 'ics'
+        config = Config()
+        
+        assert config.get('aws.region') == 'ap-northeast-1'
+        assert config.get('aws.profile') is None
+        assert config.get('calendar.default_timezone') == 'UTC'
+        assert config.get('calendar.output_format') == 'ics'
 
     def test_init_with_custom_config_file(self):
         """Test initialization with custom config file path."""
         custom_path = '/custom/config.json'
-        with patch('os.path.exists', return_value=False):
-            config = Config(config_file=custom_path)
-            assert config.config_file == custom_path
+        config = Config(config_file=custom_path)
+        assert config.config_file == custom_path
 
-    def test_load_config_from_file_success(self):
+    def test_load_config_from_file_success(self, tmp_path, monkeypatch):
         """Test loading configuration from file successfully."""
         config_data = {
             'aws': {
@@ -52,183 +72,161 @@ class TestConfig:
             }
         }
         
-        mock_file_content = json.dumps(config_data)
+        config_file = tmp_path / "config.json"
+        config_file.write_text(json.dumps(config_data), encoding='utf-8')
+        monkeypatch.setattr(os.path, 'exists', lambda path: True)
         
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open(read_data=mock_file_content)):
-            config = Config()
-            
-            assert config.get('aws.region') == 'eu-west-1'
-            assert config.get('aws.profile') == 'production'
-            assert config.get('calendar.default_timezone') == 'Europe/London'
-            assert config.get('calendar.output_format') == 'csv'
+        config = Config(config_file=str(config_file))
+        
+        assert config.get('aws.region') == 'eu-west-1'
+        assert config.get('aws.profile') == 'production'
+        assert config.get('calendar.default_timezone') == 'Europe/London'
+        assert config.get('calendar.output_format') == 'csv'
 
     def test_load_config_file_not_found(self):
         """Test loading configuration when file doesn't exist."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            # Should use default values
-            assert config.get('aws.region') == 'ap-northeast-1'
+        config = Config()
+        # Should use default values
+        assert config.get('aws.region') == 'ap-northeast-1'
 
-    def test_load_config_invalid_json(self):
+    def test_load_config_invalid_json(self, tmp_path, monkeypatch, capsys):
         """Test loading configuration from invalid JSON file."""
-        invalid_json = '{ invalid json }'
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{ invalid json }', encoding='utf-8')
+        monkeypatch.setattr(os.path, 'exists', lambda path: True)
         
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open(read_data=invalid_json)), \
-             patch('builtins.print') as mock_print:
-            config = Config()
-            
-            # Should use default values and print warning
-            assert config.get('aws.region') == 'ap-northeast-1'
-            mock_print.assert_called()
+        config = Config(config_file=str(config_file))
+        
+        # Should use default values and print warning
+        assert config.get('aws.region') == 'ap-northeast-1'
+        assert "Warning" in capsys.readouterr().out
 
-    def test_load_config_io_error(self):
+    def test_load_config_io_error(self, tmp_path, monkeypatch, capsys):
         """Test loading configuration with IO error."""
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', side_effect=IOError("Permission denied")), \
-             patch('builtins.print') as mock_print:
-            config = Config()
-            
-            # Should use default values and print warning
-            assert config.get('aws.region') == 'ap-northeast-1'
-            mock_print.assert_called()
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{}', encoding='utf-8')
+        monkeypatch.setattr(os.path, 'exists', lambda path: True)
+        
+        with patch('pathlib.Path.read_text', side_effect=IOError("Permission denied")):
+            config = Config(config_file=str(config_file))
+        
+        # Should use default values and print warning
+        assert config.get('aws.region') == 'ap-northeast-1'
+        assert "Warning" in capsys.readouterr().out
 
     def test_environment_variable_override_aws_profile(self, monkeypatch):
         """Test AWS_PROFILE environment variable override."""
         monkeypatch.setenv('AWS_PROFILE', 'test-profile')
         
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('aws.profile') == 'test-profile'
+        config = Config()
+        assert config.get('aws.profile') == 'test-profile'
 
     def test_environment_variable_override_aws_region(self, monkeypatch):
         """Test AWS_DEFAULT_REGION environment variable override."""
         monkeypatch.setenv('AWS_DEFAULT_REGION', 'us-west-2')
         
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('aws.region') == 'us-west-2'
+        config = Config()
+        assert config.get('aws.region') == 'us-west-2'
 
     def test_environment_variable_override_both(self, monkeypatch):
         """Test both AWS environment variables override."""
         monkeypatch.setenv('AWS_PROFILE', 'dev-profile')
         monkeypatch.setenv('AWS_DEFAULT_REGION', 'eu-central-1')
         
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('aws.profile') == 'dev-profile'
-            assert config.get('aws.region') == 'eu-central-1'
+        config = Config()
+        assert config.get('aws.profile') == 'dev-profile'
+        assert config.get('aws.region') == 'eu-central-1'
 
     def test_merge_config_simple(self):
         """Test merging simple configuration."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
-            new_config = {'aws': {'region': 'us-east-1'}}
-            config._merge_config(new_config)
-            
-            assert config.get('aws.region') == 'us-east-1'
-            # Other values should remain
-            assert config.get('aws.profile') is None
+        config = Config()
+        
+        new_config = {'aws': {'region': 'us-east-1'}}
+        config._merge_config(new_config)
+        
+        assert config.get('aws.region') == 'us-east-1'
+        # Other values should remain
+        assert config.get('aws.profile') is None
 
     def test_merge_config_nested(self):
         """Test merging nested configuration."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
-            new_config = {
-                'aws': {'profile': 'new-profile'},
-                'calendar': {'default_timezone': 'Asia/Tokyo'}
-            }
-            config._merge_config(new_config)
-            
-            assert config.get('aws.profile') == 'new-profile'
-            assert config.get('calendar.default_timezone') == 'Asia/Tokyo'
-            # Original values should remain
-            assert config.get('aws.region') == 'ap-northeast-1'
+        config = Config()
+        
+        new_config = {
+            'aws': {'profile': 'new-profile'},
+            'calendar': {'default_timezone': 'Asia/Tokyo'}
+        }
+        config._merge_config(new_config)
+        
+        assert config.get('aws.profile') == 'new-profile'
+        assert config.get('calendar.default_timezone') == 'Asia/Tokyo'
+        # Original values should remain
+        assert config.get('aws.region') == 'ap-northeast-1'
 
     def test_merge_config_overwrite_existing(self):
         """Test merging configuration overwrites existing values."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
-            new_config = {'output': {'directory': '/new/path'}}
-            config._merge_config(new_config)
-            
-            assert config.get('output.directory') == '/new/path'
-            # Other output values should remain
-            assert config.get('output.filename_template') == '{calendar_name}_{date}.ics'
+        config = Config()
+        
+        new_config = {'output': {'directory': '/new/path'}}
+        config._merge_config(new_config)
+        
+        assert config.get('output.directory') == '/new/path'
+        # Other output values should remain
+        assert config.get('output.filename_template') == '{calendar_name}_{date}.ics'
 
-    def test_get_existing_key(self):
+    def test_get_existing_key(self, config):
         """Test getting existing configuration key."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('aws.region') == 'ap-northeast-1'
+        assert config.get('aws.region') == 'ap-northeast-1'
 
-    def test_get_nonexistent_key_with_default(self):
+    def test_get_nonexistent_key_with_default(self, config):
         """Test getting non-existent key with default value."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('nonexistent.key', 'default_value') == 'default_value'
+        assert config.get('nonexistent.key', 'default_value') == 'default_value'
 
-    def test_get_nonexistent_key_without_default(self):
+    def test_get_nonexistent_key_without_default(self, config):
         """Test getting non-existent key without default value."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            assert config.get('nonexistent.key') is None
+        assert config.get('nonexistent.key') is None
 
-    def test_get_invalid_key_path(self):
+    def test_get_invalid_key_path(self, config):
         """Test getting configuration with invalid key path."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            # Try to access string as dict
-            assert config.get('aws.region.invalid') is None
+        # Try to access string as dict
+        assert config.get('aws.region.invalid') is None
 
     def test_set_new_key(self):
         """Test setting new configuration key."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            config.set('new.key', 'new_value')
-            assert config.get('new.key') == 'new_value'
+        config = Config()
+        config.set('new.key', 'new_value')
+        assert config.get('new.key') == 'new_value'
 
     def test_set_existing_key(self):
         """Test setting existing configuration key."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            config.set('aws.region', 'us-west-1')
-            assert config.get('aws.region') == 'us-west-1'
+        config = Config()
+        config.set('aws.region', 'us-west-1')
+        assert config.get('aws.region') == 'us-west-1'
 
     def test_set_nested_new_key(self):
         """Test setting nested new configuration key."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            config.set('new.nested.key', 'nested_value')
-            assert config.get('new.nested.key') == 'nested_value'
+        config = Config()
+        config.set('new.nested.key', 'nested_value')
+        assert config.get('new.nested.key') == 'nested_value'
 
-    def test_get_aws_config(self):
+    def test_get_aws_config(self, config):
         """Test getting AWS configuration section."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            aws_config = config.get_aws_config()
-            
-            assert aws_config['region'] == 'ap-northeast-1'
-            assert aws_config['profile'] is None
+        aws_config = config.get_aws_config()
+        
+        assert aws_config['region'] == 'ap-northeast-1'
+        assert aws_config['profile'] is None
 
-    def test_get_output_config(self):
+    def test_get_output_config(self, config):
         """Test getting output configuration section."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            output_config = config.get_output_config()
-            
-            assert output_config['directory'] == './output'
-            assert output_config['filename_template'] == '{calendar_name}_{date}.ics'
+        output_config = config.get_output_config()
+        
+        assert output_config['directory'] == './output'
+        assert output_config['filename_template'] == '{calendar_name}_{date}.ics'
 
     def test_save_config_success(self):
         """Test saving configuration to file successfully."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
+        config = Config()
+        
         with patch('os.makedirs') as mock_makedirs, \
              patch('builtins.open', mock_open()) as mock_file:
             config.save_config()
@@ -236,22 +234,19 @@ class TestConfig:
             mock_makedirs.assert_called_once()
             mock_file.assert_called_once()
 
-    def test_save_config_io_error(self):
+    def test_save_config_io_error(self, capsys):
         """Test saving configuration with IO error."""
-        with patch('os.path.exists', return_value=False):
-            config = Config()
-            
+        config = Config()
+        
         with patch('os.makedirs'), \
-             patch('builtins.open', side_effect=IOError("Permission denied")), \
-             patch('builtins.print') as mock_print:
+             patch('builtins.open', side_effect=IOError("Permission denied")):
             config.save_config()
-            
-            mock_print.assert_called()
+        
+        assert "Warning" in capsys.readouterr().out
 
     def test_default_config_path_generation(self):
         """Test default configuration path generation."""
         with patch('pathlib.Path.home') as mock_home, \
-             patch('os.path.exists', return_value=False), \
              patch('pathlib.Path.mkdir') as mock_mkdir:
             mock_home.return_value = Path('/home/user')
             
@@ -260,18 +255,17 @@ class TestConfig:
             assert config.config_file == expected_path
             mock_mkdir.assert_called_once_with(exist_ok=True)
 
-    def test_file_and_env_merge_priority(self, monkeypatch):
+    def test_file_and_env_merge_priority(self, tmp_path, monkeypatch):
         """Test that environment variables override file configuration."""
         # Set environment variable
         monkeypatch.setenv('AWS_PROFILE', 'env-profile')
         
-        # Mock file with different value
-        config_data = {'aws': {'profile': 'file-profile'}}
-        mock_file_content = json.dumps(config_data)
+        # Config file with different value
+        config_file = tmp_path / "config.json"
+        config_file.write_text('{"aws": {"profile": "file-profile"}}', encoding='utf-8')
+        monkeypatch.setattr(os.path, 'exists', lambda path: True)
         
-        with patch('os.path.exists', return_value=True), \
-             patch('builtins.open', mock_open(read_data=mock_file_content)):
-            config = Config()
-            
-            # Environment variable should take priority
-            assert config.get('aws.profile') == 'env-profile'
\ No newline at end of file
+        config = Config(config_file=str(config_file))
+        
+        # Environment variable should take priority
+        assert config.get('aws.profile') == 'env-profile'
\ No newline at end of file
@@ -8,6 +8,8 @@ from unittest.mock import Mock, patch
 from datetime import date, datetime
 import tempfile
 
+from icalendar import Calendar
+
 from src.ics_generator import ICSGenerator, ICSGenerationError
 
 
@@ -106,6 +108,47 @@ class TestICSGenerator:
         assert '-//AWS//Change Calendar 1.0//EN' in ics_content
         assert 'Asia/Tokyo' in ics_content
 
+    def test_generate_ics_content_reused_until_calendar_changes(self, mock_japanese_holidays):
+        """Test generated ICS content is reused until the calendar is modified."""
+        generator = ICSGenerator(japanese_holidays=mock_japanese_holidays)
+        
+        content = generator.generate_ics_content()
+        assert generator.generate_ics_content() is content
+        
+        generator.add_timezone_definition()
+        regenerated = generator.generate_ics_content()
+        
+        assert regenerated is not content
+        assert regenerated.count('BEGIN:VTIMEZONE') == 2
+
+    def test_generate_ics_content_detects_direct_calendar_changes(self, mock_japanese_holidays):
+        """Test components added to or removed from the public calendar invalidate reused content."""
+        generator = ICSGenerator(japanese_holidays=mock_japanese_holidays)
+        content = generator.generate_ics_content()
+        
+        event = generator.generate_holiday_event(date(2024, 1, 1), "元日")
+        generator.calendar.add_component(event)
+        with_event = generator.generate_ics_content()
+        assert with_event is not content
+        assert '元日' in with_event
+        
+        generator.calendar.subcomponents.remove(event)
+        assert '元日' not in generator.generate_ics_content()
+        
+        generator.calendar = Calendar()
+        assert 'Asia/Tokyo' not in generator.generate_ics_content()
+
+    def test_generate_ics_content_requires_generator_methods_for_in_place_edits(self, mock_japanese_holidays):
+        """Test in-place edits to an existing component are only picked up via generator methods."""
+        generator = ICSGenerator(japanese_holidays=mock_japanese_holidays)
+        content = generator.generate_ics_content()
+        
+        generator.calendar['X-WR-CALDESC'] = 'edited'
+        assert generator.generate_ics_content() is content
+        
+        generator.clear_events()
+        assert 'X-WR-CALDESC:edited' in generator.generate_ics_content()
+
     def test_save_to_file(self, mock_japanese_holidays, temp_dir):
         """Test saving ICS content to file."""
         generator = ICSGenerator(japanese_holidays=mock_japanese_holidays)